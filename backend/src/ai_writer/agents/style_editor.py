@@ -8,6 +8,7 @@ Uses low temperature (0.1) for deterministic evaluation per LLM-as-judge researc
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from ai_writer.agents.base import get_structured_llm, invoke
 from ai_writer.prompts.builders import build_style_editor_prompt
@@ -71,9 +72,28 @@ def run_style_editor(state: dict) -> dict:
     allowlist = build_story_allowlist(state)
     slop_config = configs.get("slop", SlopConfig())
 
-    wc_result = check_word_count(prose, scene_outline.target_word_count)
-    tense_result = check_tense_consistency(prose)
-    slop_result = compute_slop_score(prose, allowlist=allowlist, config=slop_config)
+    # These four are pure functions of the prose (plus priors) and their
+    # heavy parts run outside the GIL (regex/Aho-Corasick in C, spaCy
+    # tagging in Cython, numpy hashing), so overlap them on one pool;
+    # wall clock drops to the slowest check. compute_prose_structure is
+    # NOT submitted — it shares the spaCy pipeline with the tense check,
+    # which temporarily disables pipes via select_pipes.
+    prior_proses = [d.prose for d in scene_drafts[:-1]]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        wc_future = executor.submit(
+            check_word_count, prose, scene_outline.target_word_count
+        )
+        tense_future = executor.submit(check_tense_consistency, prose)
+        slop_future = executor.submit(
+            compute_slop_score, prose, allowlist=allowlist, config=slop_config
+        )
+        repetition_future = executor.submit(
+            detect_cross_scene_repetition, prose, prior_proses
+        )
+        wc_result = wc_future.result()
+        tense_result = tense_future.result()
+        slop_result = slop_future.result()
+        repetition_result = repetition_future.result()
 
     logger.info("Deterministic checks for %s:", latest_draft.scene_id)
     wc_status = "OK" if wc_result.within_tolerance else "OUT OF RANGE"
@@ -118,9 +138,7 @@ def run_style_editor(state: dict) -> dict:
     else:
         logger.info("  vocabulary: OK")
 
-    # Cross-scene repetition detection
-    prior_proses = [d.prose for d in scene_drafts[:-1]]
-    repetition_result = detect_cross_scene_repetition(prose, prior_proses)
+    # Cross-scene repetition (computed above, alongside the other checks)
     if repetition_result.repeated_count > 0:
         logger.info("  cross-scene repetitions: %d", repetition_result.repeated_count)
 
@@ -7,7 +7,6 @@ Generates side-by-side reports with:
 - Aggregate win/loss/tie and metric deltas
 """
 
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -204,9 +203,7 @@ class ReportGenerator:
     def _write_json_report(self, report: ComparisonReport, prefix: str) -> Path:
         """Write machine-readable JSON report."""
         path = self.output_dir / f"{prefix}.json"
-        data = report.model_dump()
-        path.write_text(
-            json.dumps(data, indent=2, default=str),
-            encoding="utf-8",
-        )
+        # Serialize directly in pydantic-core rather than round-tripping
+        # through model_dump() + json.dumps().
+        path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
         return path
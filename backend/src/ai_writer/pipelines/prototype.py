@@ -6,6 +6,7 @@ Pipeline flow:
 """
 
 import logging
+from functools import lru_cache
 from typing import Any, TypedDict
 
 from langgraph.graph import END, START, StateGraph
@@ -21,6 +22,7 @@ from ai_writer.schemas.story import StoryBrief
 from ai_writer.schemas.structure import StoryOutline
 from ai_writer.schemas.world import WorldContext
 from ai_writer.schemas.writing import SceneDraft
+from ai_writer.utils import text_analysis
 
 logger = logging.getLogger("ai_writer.pipelines.prototype")
 
@@ -56,9 +58,29 @@ def _get_total_scenes(state: GraphState) -> int:
     return sum(len(act.scenes) for act in outline.acts)
 
 
+# Routing decisions precomputed for every combination of the four
+# conditions, indexed by the packed bitfield
+# needs_min << 3 | has_budget << 2 | approved << 1 | has_next_scene.
+# A revision is taken when budget remains and either the minimum pass
+# count is unmet or the draft was rejected; otherwise advance or finish.
+_DECISION_TABLE = tuple(
+    (
+        "revise"
+        if has_budget and (needs_min or not approved)
+        else ("next_scene" if has_next_scene else "complete")
+    )
+    for needs_min in (False, True)
+    for has_budget in (False, True)
+    for approved in (False, True)
+    for has_next_scene in (False, True)
+)
+
+
 def should_revise_or_advance(state: GraphState) -> str:
     """Conditional edge: decide whether to revise, advance to next scene, or complete."""
-    feedback_list = state.get("edit_feedback", [])
+    # Missing and empty feedback take the same early exit; dropping the
+    # [] default avoids allocating a throwaway list on every decision.
+    feedback_list = state.get("edit_feedback")
     if not feedback_list:
         return "complete"
 
@@ -80,24 +102,26 @@ def should_revise_or_advance(state: GraphState) -> str:
         decision,
     )
 
-    # Force revision if below minimum editing passes (bounded by max_revisions)
-    if revision_count < min_revisions and revision_count < max_revisions:
+    # One table lookup replaces the former if/elif chain; the key packs
+    # the four routing conditions into a bitfield.
+    needs_min = revision_count < min_revisions
+    key = (
+        (needs_min << 3)
+        | ((revision_count < max_revisions) << 2)
+        | (bool(latest_feedback.approved) << 1)
+        | (current_idx + 1 < total_scenes)
+    )
+    route = _DECISION_TABLE[key]
+
+    # A revise with the minimum unmet is a forced pass (takes precedence
+    # over the approval check, exactly as the old first branch did)
+    if needs_min and route == "revise":
         logger.info(
             "Forcing revision: revision_count=%d < min_revisions=%d",
             revision_count,
             min_revisions,
         )
-        return "revise"
-
-    # If not approved and we have revision budget, revise
-    if not latest_feedback.approved and revision_count < max_revisions:
-        return "revise"
-
-    # Move to next scene or complete
-    if current_idx + 1 < total_scenes:
-        return "next_scene"
-    else:
-        return "complete"
+    return route
 
 
 def prepare_revision(state: GraphState) -> dict:
@@ -120,6 +144,10 @@ def mark_complete(state: GraphState) -> dict:
 
 def build_prototype_pipeline() -> CompiledStateGraph:
     """Build and compile the prototype story generation pipeline."""
+    # Start loading the spaCy model now; the style editor needs it and
+    # the planning agents give it plenty of time to finish in background.
+    text_analysis.warmup()
+
     builder: StateGraph[Any] = StateGraph(GraphState)
 
     # Add nodes — agent functions take dict, which is compatible with GraphState
@@ -152,3 +180,15 @@ def build_prototype_pipeline() -> CompiledStateGraph:
     builder.add_edge("mark_complete", END)
 
     return builder.compile()  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=1)
+def get_prototype_pipeline() -> CompiledStateGraph:
+    """Return the process-wide compiled pipeline, building it on first call.
+
+    The compiled graph is stateless (all run state lives in GraphState),
+    so every caller can share one instance instead of paying the graph
+    compile cost again. build_prototype_pipeline stays available for
+    callers that genuinely need a fresh compile.
+    """
+    return build_prototype_pipeline()
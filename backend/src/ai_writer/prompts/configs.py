@@ -31,12 +31,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class StoryBriefPromptConfig(BaseModel):
     """Variables for Plot Architect (StoryBrief) system prompt."""
 
+    model_config = ConfigDict(defer_build=True)
+
     role_name: str = "Plot Architect"
     num_themes: str = "2-4"
     num_acts: int = 1
@@ -51,6 +53,8 @@ class StoryBriefPromptConfig(BaseModel):
 class CharacterRosterPromptConfig(BaseModel):
     """Variables for Plot Architect (CharacterRoster) system prompt."""
 
+    model_config = ConfigDict(defer_build=True)
+
     role_name: str = "Casting Director"
     closing_motivation: str = "Make characters feel real and distinct from each other."
 
@@ -58,6 +62,8 @@ class CharacterRosterPromptConfig(BaseModel):
 class WorldContextPromptConfig(BaseModel):
     """Variables for Plot Architect (WorldContext) system prompt."""
 
+    model_config = ConfigDict(defer_build=True)
+
     role_name: str = "Lore Master"
     closing_motivation: str = "The world should feel consistent and lived-in."
 
@@ -65,6 +71,8 @@ class WorldContextPromptConfig(BaseModel):
 class BeatOutlinerPromptConfig(BaseModel):
     """Variables for Beat Outliner system prompt."""
 
+    model_config = ConfigDict(defer_build=True)
+
     role_name: str = "Beat Outliner"
     closing_motivation: str = Field(
         default=(
@@ -81,6 +89,8 @@ class SceneWriterPromptConfig(BaseModel):
     overridden at runtime from the StoryBrief's tone_profile.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     role_name: str = "Scene Writer"
     formality: float = 0.5
     darkness: float = 0.5
@@ -101,6 +111,8 @@ class SceneWriterPromptConfig(BaseModel):
 class SlopConfig(BaseModel):
     """Scoring parameters for slop detection."""
 
+    model_config = ConfigDict(defer_build=True)
+
     phrase_penalty_scale: float = 10.0  # multiplier in ratio formula
     word_excess_weight: float = 0.3  # penalty per excess word occurrence
     word_min_severity: float = 0.5  # minimum severity for word-level scan
@@ -110,6 +122,8 @@ class SlopConfig(BaseModel):
 class ProseStructureConfig(BaseModel):
     """Thresholds for structural monotony detection."""
 
+    model_config = ConfigDict(defer_build=True)
+
     opener_monotony_threshold: float = 0.30  # >30% same POS opener
     length_cv_threshold: float = 0.30  # CV below this = monotonous
     passive_ratio_threshold: float = 0.20  # >20% passive
@@ -119,6 +133,8 @@ class ProseStructureConfig(BaseModel):
 class VocabularyConfig(BaseModel):
     """Thresholds for vocabulary analysis."""
 
+    model_config = ConfigDict(defer_build=True)
+
     mtld_threshold: float = 60.0  # below = low diversity
     zipf_threshold: float = 5.5  # above = overly common vocabulary
     mattr_window: int = 50
@@ -131,6 +147,8 @@ class ScoreCapConfig(BaseModel):
     rather than relying on advisory language the LLM may ignore.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     cap_pacing_on_monotony: int = 2
     severe_opener_threshold: float = 0.45  # above this = hard cap at 2
     cap_prose_on_slop_count: int = 3  # threshold: confirmed_slop >= this
@@ -146,6 +164,8 @@ class AdvisoryPenaltyConfig(BaseModel):
     max vocabulary: 0.06, max cross-scene: 0.06. Total max: 0.24.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     opener_monotony: float = 0.04
     length_monotony: float = 0.04
     passive_heavy: float = 0.02
@@ -162,6 +182,8 @@ class StyleEditorPromptConfig(BaseModel):
     Tone values default here but are overridden at runtime from tone_profile.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     role_name: str = "Style Editor"
     formality: float = 0.5
     darkness: float = 0.5
@@ -188,8 +210,15 @@ class PrototypeConfig(BaseModel):
     to build the per-agent dict the pipeline expects.
 
     To create a new experiment, copy a script and change these values.
+
+    Frozen: scripts define one config per run and never mutate it, which
+    lets ``to_prompt_configs()`` build its fan-out once and reuse it.
     """
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    _prompt_configs: dict[str, Any] | None = PrivateAttr(default=None)
+
     # ── Story Structure ──────────────────────────────────────────────
     num_acts: int = 1
     scenes_per_act: str = "2-3"
@@ -295,88 +324,110 @@ class PrototypeConfig(BaseModel):
 
         Returns a dict keyed by agent name, suitable for passing directly
         into the pipeline's ``prompt_configs`` state field.
+
+        Delegates to a memoized module-level builder: the mapping is fully
+        static, so equal (frozen) configs share one build — the per-call
+        cost collapses to a PrivateAttr read after the first call.
         """
-        return {
-            "story_brief": StoryBriefPromptConfig(
-                role_name=self.story_brief_role,
-                num_themes=self.num_themes,
-                num_acts=self.num_acts,
-                scenes_per_act=self.scenes_per_act,
-                min_word_count=self.min_word_count,
-                max_word_count=self.max_word_count,
-                closing_motivation=self.story_brief_motivation,
-            ),
-            "character_roster": CharacterRosterPromptConfig(
-                role_name=self.character_roster_role,
-                closing_motivation=self.character_roster_motivation,
-            ),
-            "world_context": WorldContextPromptConfig(
-                role_name=self.world_context_role,
-                closing_motivation=self.world_context_motivation,
-            ),
-            "beat_outliner": BeatOutlinerPromptConfig(
-                role_name=self.beat_outliner_role,
-                closing_motivation=self.beat_outliner_motivation,
-            ),
-            "scene_writer": SceneWriterPromptConfig(
-                role_name=self.scene_writer_role,
-                formality=self.default_formality,
-                darkness=self.default_darkness,
-                humor=self.default_humor,
-                pacing=self.default_pacing,
-                prose_style=self.prose_style,
-                closing_motivation=self.scene_writer_motivation,
-                creative_temperature=self.creative_temperature,
-                frequency_penalty=self.frequency_penalty,
-                presence_penalty=self.presence_penalty,
-            ),
-            "style_editor": StyleEditorPromptConfig(
-                role_name=self.style_editor_role,
-                formality=self.default_formality,
-                darkness=self.default_darkness,
-                humor=self.default_humor,
-                pacing=self.default_pacing,
-                normalization_guidance=self.normalization_guidance,
-                rubric_cv_threshold=str(self.length_cv_threshold),
-                rubric_opener_percent=f"{self.opener_monotony_threshold:.0%}",
-            ),
-            "prose_structure": ProseStructureConfig(
-                opener_monotony_threshold=self.opener_monotony_threshold,
-                length_cv_threshold=self.length_cv_threshold,
-                passive_ratio_threshold=self.passive_ratio_threshold,
-                dep_distance_std_threshold=self.dep_distance_std_threshold,
-            ),
-            "vocabulary": VocabularyConfig(
-                mtld_threshold=self.mtld_threshold,
-                zipf_threshold=self.zipf_threshold,
-                mattr_window=self.mattr_window,
-            ),
-            "slop": SlopConfig(
-                phrase_penalty_scale=self.slop_phrase_penalty_scale,
-                word_excess_weight=self.slop_word_excess_weight,
-                word_min_severity=self.slop_word_min_severity,
-                word_free_occurrences=self.slop_word_free_occurrences,
-            ),
-            "score_caps": ScoreCapConfig(
-                cap_pacing_on_monotony=self.cap_pacing_on_monotony,
-                severe_opener_threshold=self.severe_opener_threshold,
-                cap_prose_on_slop_count=self.cap_prose_on_slop_count,
-                cap_prose_on_slop_value=self.cap_prose_on_slop_value,
-                cap_prose_on_low_diversity=self.cap_prose_on_low_diversity,
-                cap_prose_on_persistent_slop=self.cap_prose_on_persistent_slop,
-            ),
-            "tone_override": self.tone_override,
-            "planning_temperature": self.planning_temperature,
-            "eval_temperature": self.eval_temperature,
-            "approve_threshold": self.approve_threshold,
-            "advisory_penalties": AdvisoryPenaltyConfig(
-                opener_monotony=self.penalty_opener_monotony,
-                length_monotony=self.penalty_length_monotony,
-                passive_heavy=self.penalty_passive_heavy,
-                structural_monotony=self.penalty_structural_monotony,
-                low_diversity=self.penalty_low_diversity,
-                vocabulary_basic=self.penalty_vocabulary_basic,
-                cross_scene_per=self.penalty_cross_scene_per,
-                cross_scene_max=self.penalty_cross_scene_max,
-            ),
-        }
+        if self._prompt_configs is None:
+            key = tuple(self.__dict__.values())  # field values, all hashable
+            cached = _PROMPT_CONFIG_CACHE.get(key)
+            if cached is None:
+                cached = _PROMPT_CONFIG_CACHE[key] = _build_prompt_configs(self)
+            self._prompt_configs = cached
+        return self._prompt_configs
+
+
+_PROMPT_CONFIG_CACHE: dict[tuple, dict[str, Any]] = {}
+
+
+def _build_prompt_configs(self: PrototypeConfig) -> dict[str, Any]:
+    """Straight-line prompt-config builder, memoized per distinct config.
+
+    Sub-configs are assembled with ``model_construct`` — every input field
+    was already validated when the parent PrototypeConfig was created.
+    """
+    return {
+        "story_brief": StoryBriefPromptConfig.model_construct(
+            role_name=self.story_brief_role,
+            num_themes=self.num_themes,
+            num_acts=self.num_acts,
+            scenes_per_act=self.scenes_per_act,
+            min_word_count=self.min_word_count,
+            max_word_count=self.max_word_count,
+            closing_motivation=self.story_brief_motivation,
+        ),
+        "character_roster": CharacterRosterPromptConfig.model_construct(
+            role_name=self.character_roster_role,
+            closing_motivation=self.character_roster_motivation,
+        ),
+        "world_context": WorldContextPromptConfig.model_construct(
+            role_name=self.world_context_role,
+            closing_motivation=self.world_context_motivation,
+        ),
+        "beat_outliner": BeatOutlinerPromptConfig.model_construct(
+            role_name=self.beat_outliner_role,
+            closing_motivation=self.beat_outliner_motivation,
+        ),
+        "scene_writer": SceneWriterPromptConfig.model_construct(
+            role_name=self.scene_writer_role,
+            formality=self.default_formality,
+            darkness=self.default_darkness,
+            humor=self.default_humor,
+            pacing=self.default_pacing,
+            prose_style=self.prose_style,
+            closing_motivation=self.scene_writer_motivation,
+            creative_temperature=self.creative_temperature,
+            frequency_penalty=self.frequency_penalty,
+            presence_penalty=self.presence_penalty,
+        ),
+        "style_editor": StyleEditorPromptConfig.model_construct(
+            role_name=self.style_editor_role,
+            formality=self.default_formality,
+            darkness=self.default_darkness,
+            humor=self.default_humor,
+            pacing=self.default_pacing,
+            normalization_guidance=self.normalization_guidance,
+            rubric_cv_threshold=str(self.length_cv_threshold),
+            rubric_opener_percent=f"{self.opener_monotony_threshold:.0%}",
+        ),
+        "prose_structure": ProseStructureConfig.model_construct(
+            opener_monotony_threshold=self.opener_monotony_threshold,
+            length_cv_threshold=self.length_cv_threshold,
+            passive_ratio_threshold=self.passive_ratio_threshold,
+            dep_distance_std_threshold=self.dep_distance_std_threshold,
+        ),
+        "vocabulary": VocabularyConfig.model_construct(
+            mtld_threshold=self.mtld_threshold,
+            zipf_threshold=self.zipf_threshold,
+            mattr_window=self.mattr_window,
+        ),
+        "slop": SlopConfig.model_construct(
+            phrase_penalty_scale=self.slop_phrase_penalty_scale,
+            word_excess_weight=self.slop_word_excess_weight,
+            word_min_severity=self.slop_word_min_severity,
+            word_free_occurrences=self.slop_word_free_occurrences,
+        ),
+        "score_caps": ScoreCapConfig.model_construct(
+            cap_pacing_on_monotony=self.cap_pacing_on_monotony,
+            severe_opener_threshold=self.severe_opener_threshold,
+            cap_prose_on_slop_count=self.cap_prose_on_slop_count,
+            cap_prose_on_slop_value=self.cap_prose_on_slop_value,
+            cap_prose_on_low_diversity=self.cap_prose_on_low_diversity,
+            cap_prose_on_persistent_slop=self.cap_prose_on_persistent_slop,
+        ),
+        "tone_override": self.tone_override,
+        "planning_temperature": self.planning_temperature,
+        "eval_temperature": self.eval_temperature,
+        "approve_threshold": self.approve_threshold,
+        "advisory_penalties": AdvisoryPenaltyConfig.model_construct(
+            opener_monotony=self.penalty_opener_monotony,
+            length_monotony=self.penalty_length_monotony,
+            passive_heavy=self.penalty_passive_heavy,
+            structural_monotony=self.penalty_structural_monotony,
+            low_diversity=self.penalty_low_diversity,
+            vocabulary_basic=self.penalty_vocabulary_basic,
+            cross_scene_per=self.penalty_cross_scene_per,
+            cross_scene_max=self.penalty_cross_scene_max,
+        ),
+    }
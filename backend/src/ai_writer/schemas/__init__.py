@@ -1,55 +1,59 @@
-"""Pydantic schemas for agent data contracts."""
-
-from ai_writer.schemas.characters import (
-    CharacterProfile,
-    CharacterRelationship,
-    CharacterRole,
-    CharacterRoster,
-)
-from ai_writer.schemas.editing import EditFeedback, EditItem, EditSeverity, EditType
-from ai_writer.schemas.pipeline import PipelineState
-from ai_writer.schemas.story import Genre, ScopeParameters, StoryBrief, ToneProfile
-from ai_writer.schemas.structure import (
-    ActOutline,
-    BeatType,
-    EmotionalValence,
-    NarrativeBeat,
-    SceneOutline,
-    StoryOutline,
-)
-from ai_writer.schemas.world import Location, WorldContext, WorldRule
-from ai_writer.schemas.writing import ActDraft, SceneDraft
-
-__all__ = [
+"""Pydantic schemas for agent data contracts.
+
+Submodules are imported lazily (PEP 562): importing ``ai_writer.schemas``
+no longer builds every model in the package — each schema module loads on
+first attribute access, so scripts that only need one model skip the rest.
+"""
+
+import importlib
+
+# Maps each exported name to the submodule that defines it.
+_NAME_TO_MODULE = {
     # story
-    "Genre",
-    "ToneProfile",
-    "ScopeParameters",
-    "StoryBrief",
+    "Genre": "story",
+    "ToneProfile": "story",
+    "ScopeParameters": "story",
+    "StoryBrief": "story",
     # characters
-    "CharacterRole",
-    "CharacterProfile",
-    "CharacterRelationship",
-    "CharacterRoster",
+    "CharacterRole": "characters",
+    "CharacterProfile": "characters",
+    "CharacterRelationship": "characters",
+    "CharacterRoster": "characters",
     # world
-    "Location",
-    "WorldRule",
-    "WorldContext",
+    "Location": "world",
+    "WorldRule": "world",
+    "WorldContext": "world",
     # structure
-    "BeatType",
-    "EmotionalValence",
-    "NarrativeBeat",
-    "SceneOutline",
-    "ActOutline",
-    "StoryOutline",
+    "BeatType": "structure",
+    "EmotionalValence": "structure",
+    "NarrativeBeat": "structure",
+    "SceneOutline": "structure",
+    "ActOutline": "structure",
+    "StoryOutline": "structure",
     # writing
-    "SceneDraft",
-    "ActDraft",
+    "SceneDraft": "writing",
+    "ActDraft": "writing",
     # editing
-    "EditType",
-    "EditSeverity",
-    "EditItem",
-    "EditFeedback",
+    "EditType": "editing",
+    "EditSeverity": "editing",
+    "EditItem": "editing",
+    "EditFeedback": "editing",
     # pipeline
-    "PipelineState",
-]
+    "PipelineState": "pipeline",
+}
+
+__all__ = list(_NAME_TO_MODULE)
+
+
+def __getattr__(name: str):
+    try:
+        module = _NAME_TO_MODULE[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"ai_writer.schemas.{module}"), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
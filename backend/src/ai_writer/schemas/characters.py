@@ -1,8 +1,12 @@
 """Character schemas for casting and relationship tracking."""
 
+import sys
+from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CharacterRole(str, Enum):
@@ -18,9 +22,17 @@ class CharacterRole(str, Enum):
     FOIL = "foil"
 
 
+# Intern role values so hot-path filters can compare members by identity.
+for _member in CharacterRole:
+    sys.intern(_member.value)
+del _member
+
+
 class CharacterProfile(BaseModel):
     """Complete character profile for consistent writing."""
 
+    model_config = ConfigDict(defer_build=True)
+
     character_id: str = Field(min_length=1)
     name: str = Field(min_length=1)
     role: CharacterRole
@@ -38,29 +50,63 @@ class CharacterProfile(BaseModel):
         description="Example phrases or verbal tics",
     )
 
+    @field_validator("character_id")
+    @classmethod
+    def _intern_character_id(cls, v: str) -> str:
+        # Character IDs key the roster index and recur in scene outlines;
+        # interning lets those lookups compare by identity.
+        return sys.intern(v)
 
-class CharacterRelationship(BaseModel):
-    """Directed relationship between two characters."""
 
-    from_character_id: str = Field(min_length=1)
-    to_character_id: str = Field(min_length=1)
-    relationship_type: str = Field(min_length=1)
-    description: str = Field(default="")
+@dataclass(slots=True, frozen=True)
+class CharacterRelationship:
+    """Directed relationship between two characters.
+
+    A plain value object: only primitive fields, created in bulk and never
+    revalidated, so a slotted frozen dataclass beats a BaseModel here.
+    Pydantic still validates it when nested inside CharacterRoster — the
+    Annotated Field metadata keeps the original min_length constraints.
+    """
+
+    from_character_id: Annotated[str, Field(min_length=1)]
+    to_character_id: Annotated[str, Field(min_length=1)]
+    relationship_type: Annotated[str, Field(min_length=1)]
+    description: str = ""
 
 
 class CharacterRoster(BaseModel):
     """The full cast of characters with their relationships."""
 
+    model_config = ConfigDict(defer_build=True)
+
     characters: list[CharacterProfile] = Field(default_factory=list)
     relationships: list[CharacterRelationship] = Field(default_factory=list)
 
+    @cached_property
+    def _by_id(self) -> dict[str, CharacterProfile]:
+        """Characters indexed by ID, built lazily on first lookup.
+
+        Cached on the instance; rosters are not mutated after the casting
+        agent produces them.
+        """
+        return {c.character_id: c for c in self.characters}
+
     def get_character(self, character_id: str) -> CharacterProfile | None:
         """Look up a character by ID."""
+        return self._by_id.get(character_id)
+
+    @cached_property
+    def _by_role(self) -> dict[CharacterRole, tuple[CharacterProfile, ...]]:
+        """Characters bucketed by role, built lazily on first lookup.
+
+        Cached on the instance; rosters are not mutated after the casting
+        agent produces them.
+        """
+        buckets: dict[CharacterRole, list[CharacterProfile]] = {}
         for c in self.characters:
-            if c.character_id == character_id:
-                return c
-        return None
+            buckets.setdefault(c.role, []).append(c)
+        return {role: tuple(group) for role, group in buckets.items()}
 
     def get_characters_by_role(self, role: CharacterRole) -> list[CharacterProfile]:
         """Get all characters with a given role."""
-        return [c for c in self.characters if c.role == role]
+        return list(self._by_role.get(role, ()))
@@ -9,10 +9,13 @@ Two-tier schema design:
 
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 if TYPE_CHECKING:
     from ai_writer.prompts.configs import AdvisoryPenaltyConfig
@@ -38,9 +41,18 @@ class EditSeverity(str, Enum):
     REQUIRED = "required"
 
 
+# Intern the enum payload strings so value comparisons in filters hit the
+# fast pointer-equality path inside str __eq__.
+for _member in (*EditType, *EditSeverity):
+    sys.intern(_member.value)
+del _member
+
+
 class EditItem(BaseModel):
     """A single editorial note."""
 
+    model_config = ConfigDict(defer_build=True)
+
     edit_type: EditType
     severity: EditSeverity
     location_hint: str = Field(
@@ -63,6 +75,8 @@ class StyleEditorOutput(BaseModel):
     With method="json_schema" Gemini fills fields in declaration order.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     dimension_reasoning: str = Field(
         description="Evidence-based reasoning for each dimension score"
     )
@@ -108,8 +122,45 @@ DIMENSION_WEIGHTS: dict[str, float] = {
     "prose_quality": 0.20,
 }
 
+# Flat (attr, weight) view of DIMENSION_WEIGHTS for hot-path scoring.
+_WEIGHTED_DIMS: tuple[tuple[str, float], ...] = tuple(DIMENSION_WEIGHTS.items())
+
+
+@lru_cache(maxsize=8)
+def _advisory_penalty_table(
+    penalties: tuple[float, float, float, float, float, float],
+) -> tuple[float, ...]:
+    """Penalty sum for every combination of the six advisory flags.
+
+    Indexed by a 6-bit mask (bit k set = flag k active), replacing the
+    per-call branch ladder with a single table lookup. Cached per penalty
+    configuration since runs rarely use more than one.
+    """
+    return tuple(
+        sum(p for k, p in enumerate(penalties) if (mask >> k) & 1) for mask in range(64)
+    )
+
+
 APPROVE_THRESHOLD = 0.7
 
+# Template for SceneRubric.dimension_summary; %-formatting against a tuple
+# is cheaper than the equivalent multi-part f-string on every log line.
+_SUMMARY_FMT = "style=%d/4 voice=%d/4 outline=%d/4 pacing=%d/4 prose=%d/4"
+
+
+def _penalty_key(penalty_config: AdvisoryPenaltyConfig) -> tuple:
+    """Hashable identity of a penalty configuration, shared by the rubric caches."""
+    return (
+        penalty_config.opener_monotony,
+        penalty_config.length_monotony,
+        penalty_config.passive_heavy,
+        penalty_config.structural_monotony,
+        penalty_config.low_diversity,
+        penalty_config.vocabulary_basic,
+        penalty_config.cross_scene_per,
+        penalty_config.cross_scene_max,
+    )
+
 
 class SceneRubric(BaseModel):
     """Full rubric combining deterministic checks and LLM dimension scores.
@@ -117,8 +168,14 @@ class SceneRubric(BaseModel):
     Deterministic checks are filled by Python code (zero LLM cost).
     Dimension scores are filled from StyleEditorOutput (1 LLM call).
     Composite score and approval are computed algorithmically.
+
+    Frozen: the editor fills every field at construction and nothing
+    mutates a rubric afterwards, which is what makes the score and
+    approval caches below safe.
     """
 
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     # --- Deterministic checks (filled by Python) ---
     word_count_in_range: bool = Field(default=True)
     tense_consistent: bool = Field(default=True)
@@ -162,6 +219,13 @@ class SceneRubric(BaseModel):
     # --- Chain-of-thought reasoning ---
     dimension_reasoning: str = Field(default="")
 
+    # Memoized quality scores and approvals keyed by penalty
+    # configuration (plus threshold for approvals). Rubrics are frozen
+    # once the editor builds them, but the score is re-read for gating,
+    # logging, and summaries.
+    _score_cache: dict[tuple, float] = PrivateAttr(default_factory=dict)
+    _approved_cache: dict[tuple, bool] = PrivateAttr(default_factory=dict)
+
     def compute_quality_score(
         self, penalty_config: AdvisoryPenaltyConfig | None = None
     ) -> float:
@@ -178,53 +242,62 @@ class SceneRubric(BaseModel):
 
             penalty_config = AdvisoryPenaltyConfig()
 
-        dimensions = {
-            "style_adherence": self.style_adherence,
-            "character_voice": self.character_voice,
-            "outline_adherence": self.outline_adherence,
-            "pacing": self.pacing,
-            "prose_quality": self.prose_quality,
-        }
-
-        weighted_sum = sum(
-            dimensions[dim] * DIMENSION_WEIGHTS[dim] for dim in dimensions
+        cache_key = _penalty_key(penalty_config)
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Straight-line sum over the fixed dimensions (see _WEIGHTED_DIMS);
+        # avoids building a dict + generator per call in the revision loop.
+        weighted_sum = (
+            self.style_adherence * 0.20
+            + self.character_voice * 0.20
+            + self.outline_adherence * 0.20
+            + self.pacing * 0.20
+            + self.prose_quality * 0.20
         )
         # Normalize: min possible = 1.0, max possible = 4.0
         normalized = (weighted_sum - 1.0) / 3.0
 
-        # Soft penalty for advisory metrics
-        advisory_penalty = 0.0
-        if self.opener_monotony:
-            advisory_penalty += penalty_config.opener_monotony
-        if self.length_monotony:
-            advisory_penalty += penalty_config.length_monotony
-        if self.passive_heavy:
-            advisory_penalty += penalty_config.passive_heavy
-        if self.structural_monotony:
-            advisory_penalty += penalty_config.structural_monotony
-        if self.low_diversity:
-            advisory_penalty += penalty_config.low_diversity
-        if self.vocabulary_basic:
-            advisory_penalty += penalty_config.vocabulary_basic
+        # Soft penalty for advisory metrics: pack the six flags into a
+        # bitmask and look up the precomputed sum instead of branching.
+        mask = (
+            self.opener_monotony
+            | (self.length_monotony << 1)
+            | (self.passive_heavy << 2)
+            | (self.structural_monotony << 3)
+            | (self.low_diversity << 4)
+            | (self.vocabulary_basic << 5)
+        )
+        advisory_penalty = _advisory_penalty_table(
+            (
+                penalty_config.opener_monotony,
+                penalty_config.length_monotony,
+                penalty_config.passive_heavy,
+                penalty_config.structural_monotony,
+                penalty_config.low_diversity,
+                penalty_config.vocabulary_basic,
+            )
+        )[mask]
 
         # Cross-scene repetition penalty
         advisory_penalty += penalty_config.cross_scene_per * min(
             self.cross_scene_repetitions, penalty_config.cross_scene_max
         )
 
-        return round(max(0.0, min(1.0, normalized - advisory_penalty)), 2)
+        score = round(max(0.0, min(1.0, normalized - advisory_penalty)), 2)
+        self._score_cache[cache_key] = score
+        return score
 
     def has_critical_failure(self) -> bool:
         """Any dimension at 1/4 is a critical failure requiring revision."""
-        return any(
-            score <= 1
-            for score in [
-                self.style_adherence,
-                self.character_voice,
-                self.outline_adherence,
-                self.pacing,
-                self.prose_quality,
-            ]
+        # Short-circuit boolean chain: no list/generator allocation per call.
+        return (
+            self.style_adherence <= 1
+            or self.character_voice <= 1
+            or self.outline_adherence <= 1
+            or self.pacing <= 1
+            or self.prose_quality <= 1
         )
 
     def compute_approved(
@@ -234,26 +307,43 @@ class SceneRubric(BaseModel):
     ) -> bool:
         """Composite approval: score >= threshold AND no critical failures
         AND deterministic checks pass.
+
+        Memoized like compute_quality_score: the result is pure in the
+        frozen fields, the penalty configuration, and the threshold.
         """
+        if penalty_config is None:
+            from ai_writer.prompts.configs import AdvisoryPenaltyConfig
+
+            penalty_config = AdvisoryPenaltyConfig()
+
+        cache_key = (*_penalty_key(penalty_config), approve_threshold)
+        cached = self._approved_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         score_ok = self.compute_quality_score(penalty_config) >= approve_threshold
         no_critical = not self.has_critical_failure()
         deterministic_ok = self.word_count_in_range and self.tense_consistent
-        return score_ok and no_critical and deterministic_ok
+        approved = score_ok and no_critical and deterministic_ok
+        self._approved_cache[cache_key] = approved
+        return approved
 
     def dimension_summary(self) -> str:
         """One-line summary of all dimension scores."""
-        return (
-            f"style={self.style_adherence}/4 "
-            f"voice={self.character_voice}/4 "
-            f"outline={self.outline_adherence}/4 "
-            f"pacing={self.pacing}/4 "
-            f"prose={self.prose_quality}/4"
+        return _SUMMARY_FMT % (
+            self.style_adherence,
+            self.character_voice,
+            self.outline_adherence,
+            self.pacing,
+            self.prose_quality,
         )
 
 
 class EditFeedback(BaseModel):
     """Complete editorial feedback for a scene."""
 
+    model_config = ConfigDict(defer_build=True)
+
     scene_id: str = Field(min_length=1)
     editor_name: str = Field(default="style_editor")
     edits: list[EditItem] = Field(default_factory=list)
@@ -272,9 +362,27 @@ class EditFeedback(BaseModel):
     confirmed_slop: list[str] = Field(default_factory=list)
     rubric: SceneRubric = Field(default_factory=SceneRubric)
 
+    @field_validator("scene_id")
+    @classmethod
+    def _intern_scene_id(cls, v: str) -> str:
+        # Interned to match the scene_id on outlines and drafts, so the
+        # per-scene lookups in the revision loop compare by identity.
+        return sys.intern(v)
 
-class SceneMetrics(BaseModel):
-    """Per-scene metrics snapshot for trend tracking."""
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes directly in pydantic-core (no dict
+        round-trip); feedback is re-serialized per scene for logs."""
+        return type(self).__pydantic_serializer__.to_json(self)
+
+
+@dataclass(slots=True, frozen=True)
+class SceneMetrics:
+    """Per-scene metrics snapshot for trend tracking.
+
+    Plain primitive fields built once per scene from already-computed
+    metrics — a slotted frozen dataclass, not a BaseModel, to keep
+    per-scene construction cheap. Use ``dataclasses.asdict`` for JSON.
+    """
 
     scene_id: str
     slop_ratio: float
@@ -1,6 +1,6 @@
 """LangGraph pipeline state schema."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from ai_writer.schemas.characters import CharacterRoster
 from ai_writer.schemas.editing import EditFeedback
@@ -9,6 +9,20 @@ from ai_writer.schemas.structure import StoryOutline
 from ai_writer.schemas.world import WorldContext
 from ai_writer.schemas.writing import SceneDraft
 
+# Shared sentinel for collection fields in trusted construction paths.
+# Transient states are built and dropped without ever appending, so the
+# per-instance empty lists from default_factory are wasted allocations.
+# Copy-on-write contract: promote to a fresh list before mutating.
+_EMPTY: tuple = ()
+
+# Reusable adapters for (re)hydrating list fields from checkpoints: one
+# validate_python call stays inside pydantic-core for the whole list
+# instead of dispatching per item from Python.
+_SCENE_DRAFTS_ADAPTER: TypeAdapter[list[SceneDraft]] = TypeAdapter(list[SceneDraft])
+_EDIT_FEEDBACK_ADAPTER: TypeAdapter[list[EditFeedback]] = TypeAdapter(
+    list[EditFeedback]
+)
+
 
 class PipelineState(BaseModel):
     """Accumulating state for the LangGraph prototype pipeline.
@@ -17,6 +31,8 @@ class PipelineState(BaseModel):
     are populated by agents as the pipeline progresses.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     # Input
     user_prompt: str = Field(min_length=1)
 
@@ -35,3 +51,63 @@ class PipelineState(BaseModel):
     min_revisions: int = Field(default=1, ge=0)
     current_stage: str = Field(default="planning")
     errors: list[str] = Field(default_factory=list)
+
+    def trusted_update(self, **changes: object) -> "PipelineState":
+        """Return a copy with ``changes`` applied, skipping re-validation.
+
+        Pipeline-internal updates only touch control-flow fields whose
+        values were already validated (or are produced by validated agent
+        outputs), so re-running recursive validation on the whole nested
+        state per node step is pure overhead. Never use this with
+        untrusted input.
+        """
+        # dict() is a straight C copy of the hash table; the {**a, **b}
+        # spelling routes through the slower PyDict_Merge path.
+        merged = dict(self.__dict__)
+        merged.update(changes)
+        return self.__class__.model_construct(**merged)
+
+    @classmethod
+    def trusted_initial(cls, user_prompt: str, **overrides: object) -> "PipelineState":
+        """Build a transient initial state without validation.
+
+        Collection fields share the ``_EMPTY`` sentinel instead of fresh
+        lists; callers that need to append must first replace the field
+        with a real list (copy-on-write).
+        """
+        fields: dict[str, object] = {
+            "user_prompt": user_prompt,
+            "scene_drafts": _EMPTY,
+            "edit_feedback": _EMPTY,
+            "errors": _EMPTY,
+        }
+        fields.update(overrides)
+        return cls.model_construct(**fields)
+
+    @staticmethod
+    def load_scene_drafts(raw: list) -> list[SceneDraft]:
+        """Validate a raw list of scene drafts in one pydantic-core pass."""
+        return _SCENE_DRAFTS_ADAPTER.validate_python(raw)
+
+    @staticmethod
+    def load_edit_feedback(raw: list) -> list[EditFeedback]:
+        """Validate a raw list of edit feedback in one pydantic-core pass."""
+        return _EDIT_FEEDBACK_ADAPTER.validate_python(raw)
+
+    @staticmethod
+    def dump_scene_drafts(drafts: list[SceneDraft]) -> list[dict]:
+        """Dump scene drafts to plain dicts in one pydantic-core pass."""
+        return _SCENE_DRAFTS_ADAPTER.dump_python(drafts)
+
+    @staticmethod
+    def dump_edit_feedback(feedback: list[EditFeedback]) -> list[dict]:
+        """Dump edit feedback to plain dicts in one pydantic-core pass."""
+        return _EDIT_FEEDBACK_ADAPTER.dump_python(feedback)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes directly in pydantic-core.
+
+        Skips the model_dump() -> json.dumps() round-trip through Python
+        dicts; used for checkpoints and logs that serialize state often.
+        """
+        return type(self).__pydantic_serializer__.to_json(self)
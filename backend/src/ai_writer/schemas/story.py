@@ -2,7 +2,7 @@
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Genre(str, Enum):
@@ -21,6 +21,8 @@ class Genre(str, Enum):
 class ToneProfile(BaseModel):
     """Numeric tone axes for unambiguous, actionable feedback."""
 
+    model_config = ConfigDict(defer_build=True)
+
     formality: float = Field(
         default=0.5, ge=0.0, le=1.0, description="0=casual, 1=formal"
     )
@@ -44,6 +46,8 @@ class ToneProfile(BaseModel):
 class ScopeParameters(BaseModel):
     """Controls for story length and structure."""
 
+    model_config = ConfigDict(defer_build=True)
+
     target_word_count: int = Field(default=3000, gt=0)
     num_acts: int = Field(default=1, ge=1, le=5)
     scenes_per_act: int = Field(default=3, ge=1, le=10)
@@ -53,6 +57,8 @@ class ScopeParameters(BaseModel):
 class StoryBrief(BaseModel):
     """The refined creative brief that drives all downstream agents."""
 
+    model_config = ConfigDict(defer_build=True)
+
     title: str = Field(min_length=1)
     premise: str = Field(min_length=1)
     genre: Genre
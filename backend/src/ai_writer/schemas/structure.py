@@ -4,9 +4,11 @@ These schemas force the planning agents to produce unambiguous, detailed
 outlines so that Scene Writers make zero plot decisions.
 """
 
+import sys
 from enum import Enum
+from functools import cached_property
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 
 
 class BeatType(str, Enum):
@@ -35,6 +37,8 @@ class EmotionalValence(str, Enum):
 class NarrativeBeat(BaseModel):
     """A single narrative beat within the story structure."""
 
+    model_config = ConfigDict(defer_build=True)
+
     beat_id: str = Field(min_length=1)
     act_number: int = Field(ge=1)
     sequence_number: int = Field(ge=1)
@@ -54,6 +58,8 @@ class SceneOutline(BaseModel):
     makes zero plot decisions.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     scene_id: str = Field(min_length=1)
     act_number: int = Field(ge=1)
     scene_number: int = Field(ge=1)
@@ -76,10 +82,19 @@ class SceneOutline(BaseModel):
     )
     target_word_count: int = Field(default=1000, gt=0)
 
+    @field_validator("scene_id")
+    @classmethod
+    def _intern_scene_id(cls, v: str) -> str:
+        # Scene IDs recur as comparison operands and dict keys across the
+        # pipeline; interned strings let == short-circuit on identity.
+        return sys.intern(v)
+
 
 class ActOutline(BaseModel):
     """Outline for a single act, containing beats and scenes."""
 
+    model_config = ConfigDict(defer_build=True)
+
     act_number: int = Field(ge=1)
     title: str = Field(default="")
     summary: str = Field(default="")
@@ -91,16 +106,21 @@ class ActOutline(BaseModel):
 class StoryOutline(BaseModel):
     """The complete structural outline for the story."""
 
+    model_config = ConfigDict(defer_build=True)
+
     acts: list[ActOutline] = Field(default_factory=list)
 
+    # Cached: outlines are built once by the planners and then read many
+    # times (every serialization re-reads both totals), so the act lists
+    # are stable after first access.
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def total_scenes(self) -> int:
         """Total number of scenes across all acts."""
         return sum(len(act.scenes) for act in self.acts)
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def total_beats(self) -> int:
         """Total number of narrative beats across all acts."""
         return sum(len(act.beats) for act in self.acts)
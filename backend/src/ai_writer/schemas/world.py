@@ -1,11 +1,13 @@
 """Worldbuilding schemas for setting and lore."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Location(BaseModel):
     """A specific location in the story world."""
 
+    model_config = ConfigDict(defer_build=True)
+
     location_id: str = Field(min_length=1)
     name: str = Field(min_length=1)
     description: str = Field(default="")
@@ -17,6 +19,8 @@ class Location(BaseModel):
 class WorldRule(BaseModel):
     """A rule or constraint of the story world."""
 
+    model_config = ConfigDict(defer_build=True)
+
     rule_id: str = Field(min_length=1)
     category: str = Field(
         default="general",
@@ -29,6 +33,8 @@ class WorldRule(BaseModel):
 class WorldContext(BaseModel):
     """The complete worldbuilding context for the story."""
 
+    model_config = ConfigDict(defer_build=True)
+
     setting_period: str = Field(default="")
     setting_description: str = Field(default="")
     locations: list[Location] = Field(default_factory=list)
@@ -1,11 +1,15 @@
 """Writer output schemas for scene and act drafts."""
 
-from pydantic import BaseModel, Field, computed_field
+import sys
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 
 
 class SceneDraft(BaseModel):
     """Raw prose output from the Scene Writer."""
 
+    model_config = ConfigDict(defer_build=True)
+
     scene_id: str = Field(min_length=1)
     act_number: int = Field(ge=1)
     scene_number: int = Field(ge=1)
@@ -21,10 +25,19 @@ class SceneDraft(BaseModel):
         description="Writer's notes about areas needing attention",
     )
 
+    @field_validator("scene_id")
+    @classmethod
+    def _intern_scene_id(cls, v: str) -> str:
+        # Interned to match SceneOutline.scene_id: comparisons between
+        # drafts and outlines then short-circuit on identity.
+        return sys.intern(v)
+
 
 class ActDraft(BaseModel):
     """Collection of scene drafts forming an act."""
 
+    model_config = ConfigDict(defer_build=True)
+
     act_number: int = Field(ge=1)
     scenes: list[SceneDraft] = Field(default_factory=list)
     act_summary: str = Field(default="")
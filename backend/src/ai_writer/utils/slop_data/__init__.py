@@ -10,14 +10,59 @@ Both files are loaded once at import time and cached.
 """
 
 import json
+import os
+import pickle
+from bisect import bisect_right
 from pathlib import Path
 
+try:  # 2-5x faster parse, parses bytes directly; stdlib json is the fallback
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 _DATA_DIR = Path(__file__).parent
 
-# ── Lazy-loaded caches ────────────────────────────────────────────────────
 
-_phrases_cache: list[tuple[str, float]] | None = None
-_words_cache: list[tuple[str, float]] | None = None
+def _load_processed(json_name: str, convert) -> list[tuple[str, float]]:
+    """Load a data file via a processed-pickle cache.
+
+    The converted (phrase, weight) list is pickled next to the JSON on
+    first load; later imports skip both the JSON parse and the conversion
+    loop as long as the pickle is at least as new as the JSON. Cache
+    writes are best-effort (read-only installs just re-parse).
+    """
+    json_path = _DATA_DIR / json_name
+    pkl_path = json_path.with_suffix(".pkl")
+    try:
+        if pkl_path.stat().st_mtime >= json_path.stat().st_mtime:
+            return pickle.loads(pkl_path.read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError):
+        # EOFError covers a reader racing a concurrent (pre-rename) write
+        pass
+    result = convert(_loads(json_path.read_bytes()))
+    try:
+        # Write-then-rename so concurrent readers (e.g. xdist workers)
+        # never see a truncated pickle; the pid keeps writers apart.
+        tmp_path = pkl_path.with_suffix(f".pkl.{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(result, protocol=5))
+        os.replace(tmp_path, pkl_path)
+    except OSError:
+        pass
+    return result
+
+
+# ── Lazy-loaded caches ────────────────────────────────────────────────────
+#
+# Entries are cached pre-sorted by weight descending, alongside a negated
+# weight list so min_severity filters reduce to a bisect + slice instead of
+# a re-filter + re-sort per call.
+
+_phrases_sorted: list[tuple[str, float]] | None = None
+_phrase_neg_weights: list[float] | None = None
+_words_sorted: list[tuple[str, float]] | None = None
+_word_neg_weights: list[float] | None = None
 _custom_cache: list[tuple[str, float]] | None = None
 
 
@@ -28,8 +73,10 @@ def _load_phrases() -> list[tuple[str, float]]:
     - prob 0.03125 → penalty 0.96875 (strongest AI signal)
     - prob 0.50    → penalty 0.50    (moderate signal)
     """
-    raw = json.loads((_DATA_DIR / "slop_phrases.json").read_text(encoding="utf-8"))
-    return [(phrase, round(1.0 - prob, 4)) for phrase, prob in raw]
+    return _load_processed(
+        "slop_phrases.json",
+        lambda raw: [(phrase, round(1.0 - prob, 4)) for phrase, prob in raw],
+    )
 
 
 def _load_words() -> list[tuple[str, float]]:
@@ -37,11 +84,14 @@ def _load_words() -> list[tuple[str, float]]:
 
     Normalization: count / max_count, so the most overrepresented word = 1.0.
     """
-    raw = json.loads((_DATA_DIR / "slop_words.json").read_text(encoding="utf-8"))
-    if not raw:
-        return []
-    max_count = max(count for _, count in raw)
-    return [(word, round(count / max_count, 4)) for word, count in raw]
+
+    def _convert(raw: list) -> list[tuple[str, float]]:
+        if not raw:
+            return []
+        max_count = max(count for _, count in raw)
+        return [(word, round(count / max_count, 4)) for word, count in raw]
+
+    return _load_processed("slop_words.json", _convert)
 
 
 def get_slop_phrases(min_severity: float = 0.0) -> list[tuple[str, float]]:
@@ -54,11 +104,12 @@ def get_slop_phrases(min_severity: float = 0.0) -> list[tuple[str, float]]:
     Returns:
         List of (phrase, penalty_weight) tuples sorted by weight descending.
     """
-    global _phrases_cache
-    if _phrases_cache is None:
-        _phrases_cache = _load_phrases()
-    filtered = [(p, w) for p, w in _phrases_cache if w >= min_severity]
-    return sorted(filtered, key=lambda x: x[1], reverse=True)
+    global _phrases_sorted, _phrase_neg_weights
+    if _phrases_sorted is None:
+        _phrases_sorted = sorted(_load_phrases(), key=lambda x: -x[1])
+        _phrase_neg_weights = [-w for _, w in _phrases_sorted]
+    idx = bisect_right(_phrase_neg_weights, -min_severity)
+    return _phrases_sorted[:idx]
 
 
 def get_custom_phrases() -> list[tuple[str, float]]:
@@ -72,7 +123,7 @@ def get_custom_phrases() -> list[tuple[str, float]]:
     if _custom_cache is None:
         path = _DATA_DIR / "custom_phrases.json"
         if path.exists():
-            raw = json.loads(path.read_text(encoding="utf-8"))
+            raw = _loads(path.read_bytes())
             _custom_cache = [(phrase, round(1.0 - prob, 4)) for phrase, prob in raw]
         else:
             _custom_cache = []
@@ -89,8 +140,9 @@ def get_slop_words(min_severity: float = 0.0) -> list[tuple[str, float]]:
     Returns:
         List of (word, penalty_weight) tuples sorted by weight descending.
     """
-    global _words_cache
-    if _words_cache is None:
-        _words_cache = _load_words()
-    filtered = [(w, wt) for w, wt in _words_cache if wt >= min_severity]
-    return sorted(filtered, key=lambda x: x[1], reverse=True)
+    global _words_sorted, _word_neg_weights
+    if _words_sorted is None:
+        _words_sorted = sorted(_load_words(), key=lambda x: -x[1])
+        _word_neg_weights = [-w for _, w in _words_sorted]
+    idx = bisect_right(_word_neg_weights, -min_severity)
+    return _words_sorted[:idx]
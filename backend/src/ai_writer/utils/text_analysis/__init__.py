@@ -6,11 +6,15 @@ Public API re-exports for backward compatibility:
     from ai_writer.utils.text_analysis import check_tense_consistency
 """
 
+import threading
+
 from ai_writer.prompts.configs import ProseStructureConfig, SlopConfig, VocabularyConfig
 from ai_writer.utils.text_analysis.basics import (
     TenseResult,
     WordCountResult,
+    _get_nlp,
     check_tense_consistency,
+    check_tense_consistency_batch,
     check_word_count,
 )
 from ai_writer.utils.text_analysis.context import build_story_allowlist
@@ -28,12 +32,25 @@ from ai_writer.utils.text_analysis.vocabulary import (
     compute_vocabulary_metrics,
 )
 
+
+def warmup() -> None:
+    """Preload the spaCy model in a background thread.
+
+    First use of the tense/structure checks otherwise pays the
+    en_core_web_sm load (hundreds of ms) inline; call this at process
+    start so the model is resident before the first scene edit.
+    """
+    threading.Thread(target=_get_nlp, daemon=True).start()
+
+
 __all__ = [
     # Basics
     "WordCountResult",
     "check_word_count",
     "TenseResult",
     "check_tense_consistency",
+    "check_tense_consistency_batch",
+    "warmup",
     # Slop
     "SlopConfig",
     "SlopResult",
@@ -0,0 +1,25 @@
+"""Shared spaCy parse cache for the text-analysis checks.
+
+The full pipeline run (``nlp(prose)``) dominates analysis cost, so any
+check needing parsed output should go through :func:`get_doc` — repeated
+analyses of the same prose (multiple consumers, editor re-entry) then
+share one Doc instead of re-tokenizing.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from ai_writer.utils.text_analysis.basics import _get_nlp
+
+
+@lru_cache(maxsize=4)
+def get_doc(prose: str):
+    """Parse prose with the shared spaCy model, memoized on the text.
+
+    Returns None when the model is not installed, matching _get_nlp.
+    """
+    nlp = _get_nlp()
+    if nlp is None:
+        return None
+    return nlp(prose)
@@ -0,0 +1,54 @@
+"""Shared prose tokenization for the text-analysis checks.
+
+slop and vocabulary each tokenized the prose independently (split,
+lowercase, punctuation strip, isalpha filter). One memoized pass now
+feeds both; the spaCy parse stays in _cache.get_doc so Docs are not
+held in two caches.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Leading/trailing punctuation stripped from tokens for word counting
+# (matches the slop word scan's historical strip set).
+_STRIP_CHARS = ".,!?;:\"'()-"
+
+
+@dataclass(frozen=True, slots=True)
+class PreprocessedProse:
+    """Tokenization artifacts shared across analysis passes."""
+
+    total_words: int
+    # Lowercased, punctuation-stripped token -> occurrence count
+    word_counts: Counter[str]
+    # Lowercased alphabetic tokens longer than 3 chars, in order
+    content_words_lower: tuple[str, ...]
+
+
+@lru_cache(maxsize=8)
+def preprocess(prose: str) -> PreprocessedProse:
+    """Tokenize prose once for all word-level consumers, memoized."""
+    word_counts: Counter[str] = Counter()
+    content_words: list[str] = []
+    total_words = 0
+
+    # Lowercase the whole prose in one C pass rather than per token. A
+    # whole-prose translate of the punctuation set is NOT equivalent —
+    # it would also delete punctuation inside tokens ("it's" -> "its"),
+    # while strip only trims the edges.
+    for wl in prose.lower().split():
+        total_words += 1
+        if len(wl) > 3 and wl.isalpha():
+            content_words.append(wl)
+        stripped = wl.strip(_STRIP_CHARS)
+        if stripped:
+            word_counts[stripped] += 1
+
+    return PreprocessedProse(
+        total_words=total_words,
+        word_counts=word_counts,
+        content_words_lower=tuple(content_words),
+    )
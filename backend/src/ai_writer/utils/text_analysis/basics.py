@@ -9,8 +9,20 @@ from dataclasses import dataclass
 
 # --- Word Count Check ---
 
+_TOKEN_RE = re.compile(r"\S+")
 
-@dataclass
+
+def _word_count(s: str) -> int:
+    """Count whitespace-separated tokens without materializing the list.
+
+    ``len(s.split())`` allocates a string object per word just to be
+    counted; iterating finditer matches keeps the count allocation-free
+    on multi-KB prose buffers.
+    """
+    return sum(1 for _ in _TOKEN_RE.finditer(s))
+
+
+@dataclass(slots=True)
 class WordCountResult:
     """Result of word count tolerance check."""
 
@@ -33,7 +45,7 @@ def check_word_count(
     Returns:
         WordCountResult with actual count, target, deviation, and pass/fail.
     """
-    actual = len(prose.split())
+    actual = _word_count(prose)
     if target <= 0:
         return WordCountResult(actual=actual, target=target, within_tolerance=True)
 
@@ -55,20 +67,26 @@ _nlp_model = None
 
 
 def _get_nlp():
-    """Load and cache the spaCy model. Returns None if model is not installed."""
+    """Load and cache the spaCy model. Returns None if model is not installed.
+
+    NER and the lemmatizer are excluded outright — no caller reads
+    entities or lemmas, and excluding them skips loading their weights.
+    The tagger (tense checks) and parser/attribute_ruler (structure
+    analysis) stay.
+    """
     global _nlp_model
     if _nlp_model is None:
         import spacy
 
         try:
-            _nlp_model = spacy.load("en_core_web_sm")
+            _nlp_model = spacy.load("en_core_web_sm", exclude=["ner", "lemmatizer"])
         except OSError:
             # Model not installed — return None, callers handle gracefully
             return None
     return _nlp_model
 
 
-@dataclass
+@dataclass(slots=True)
 class TenseResult:
     """Result of tense consistency analysis."""
 
@@ -79,22 +97,23 @@ class TenseResult:
     minority_ratio: float = 0.0  # ratio of the non-dominant tense
 
 
-def _strip_dialogue(prose: str) -> str:
-    """Remove quoted dialogue so tense analysis only covers narration.
+# All four quote styles in one alternation so stripping is a single pass
+# instead of four sequential re.sub calls (and three intermediate strings):
+# straight double quotes, curly/smart double quotes (U+201C / U+201D), and
+# single / curly-single quotes (U+2018 / U+2019) used as dialogue markers.
+# The single-quote branches require a capital after the opening quote so
+# contractions (she's, don't, it's) are left alone.
+_DIALOGUE_RE = re.compile(
+    r'"[^"]*"'
+    r"|\u201c[^\u201d]*\u201d"
+    r"|'[A-Z][^']*'"
+    r"|\u2018[A-Z][^\u2019]*\u2019"
+)
 
-    Handles straight double quotes, curly/smart double quotes, and
-    single quotes used as dialogue markers (capital letter after opening quote).
-    """
-    # Straight double quotes
-    stripped = re.sub(r'"[^"]*"', "", prose)
-    # Curly/smart double quotes (U+201C / U+201D)
-    stripped = re.sub(r"\u201c[^\u201d]*\u201d", "", stripped)
-    # Single-quoted dialogue (full sentences only — avoids contractions)
-    # Matches: 'Hello,' she said  but not: she's, don't, it's
-    stripped = re.sub(r"'[A-Z][^']*'", "", stripped)
-    # Curly/smart single quotes (U+2018 / U+2019) — dialogue only
-    stripped = re.sub(r"\u2018[A-Z][^\u2019]*\u2019", "", stripped)
-    return stripped
+
+def _strip_dialogue(prose: str) -> str:
+    """Remove quoted dialogue so tense analysis only covers narration."""
+    return _DIALOGUE_RE.sub("", prose)
 
 
 def check_tense_consistency(prose: str, threshold: float = 0.15) -> TenseResult:
@@ -119,8 +138,38 @@ def check_tense_consistency(prose: str, threshold: float = 0.15) -> TenseResult:
         return TenseResult(dominant_tense="unknown", consistent=True)
 
     narration = _strip_dialogue(prose)
-    doc = nlp(narration)
+    # Only token.tag_ is read here — run tagger-only, skipping the parser
+    # and attribute ruler the structure checks need.
+    unused = [p for p in ("parser", "attribute_ruler") if nlp.has_pipe(p)]
+    with nlp.select_pipes(disable=unused):
+        doc = nlp(narration)
+
+    return _tense_result_from_doc(doc, threshold)
+
+
+def check_tense_consistency_batch(
+    proses: list[str], threshold: float = 0.15
+) -> list[TenseResult]:
+    """Tense-check several scenes in one batched spaCy pass.
+
+    Same analysis as check_tense_consistency, but nlp.pipe amortizes
+    per-doc overhead when the editor evaluates a whole act at once.
+    """
+    nlp = _get_nlp()
+    if nlp is None:
+        return [TenseResult(dominant_tense="unknown", consistent=True) for _ in proses]
+
+    narrations = [_strip_dialogue(p) for p in proses]
+    unused = [p for p in ("parser", "attribute_ruler") if nlp.has_pipe(p)]
+    with nlp.select_pipes(disable=unused):
+        return [
+            _tense_result_from_doc(doc, threshold)
+            for doc in nlp.pipe(narrations, batch_size=16)
+        ]
+
 
+def _tense_result_from_doc(doc, threshold: float) -> TenseResult:
+    """Compute the tense distribution for one tagged doc."""
     past_tags = {"VBD", "VBN"}
     present_tags = {"VBP", "VBZ"}
 
@@ -8,8 +8,15 @@ phrases in the slop database.
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
+# Allowlist memo keyed by the identities of the three source objects.
+# Roster, world, and brief are built once by the planners and reused for
+# every scene pass, so the same triple recurs for the whole story run.
+# The sources are held strongly so their ids can't be recycled.
+_allowlist_cache: tuple[tuple[Any, Any, Any], set[str]] | None = None
+
 
 def build_story_allowlist(state: dict[str, Any]) -> set[str]:
     """Extract story-specific terms that should not be flagged as slop.
@@ -19,42 +26,55 @@ def build_story_allowlist(state: dict[str, Any]) -> set[str]:
     - Location names (full name + individual parts)
     - Theme words (>3 chars, lowercased)
 
+    The result is cached against the identities of the roster, world, and
+    brief objects, and each term is interned so duplicate names across
+    sources share one string object.
+
     Returns:
         A set of lowercased terms to exclude from slop detection.
     """
+    global _allowlist_cache
+
+    roster = state.get("character_roster")
+    world = state.get("world_context")
+    brief = state.get("story_brief")
+
+    if _allowlist_cache is not None:
+        (c_roster, c_world, c_brief), cached = _allowlist_cache
+        if c_roster is roster and c_world is world and c_brief is brief:
+            return cached
+
     terms: set[str] = set()
 
     # Character names
-    roster = state.get("character_roster")
     if roster is not None:
         for char in roster.characters:
             name = char.name.strip()
             if name:
-                terms.add(name.lower())
+                terms.add(sys.intern(name.lower()))
                 for part in name.split():
                     part = part.strip()
                     if len(part) > 2:
-                        terms.add(part.lower())
+                        terms.add(sys.intern(part.lower()))
 
     # Location names
-    world = state.get("world_context")
     if world is not None:
         for loc in world.locations:
             name = loc.name.strip()
             if name:
-                terms.add(name.lower())
+                terms.add(sys.intern(name.lower()))
                 for part in name.split():
                     part = part.strip()
                     if len(part) > 2:
-                        terms.add(part.lower())
+                        terms.add(sys.intern(part.lower()))
 
     # Theme words
-    brief = state.get("story_brief")
     if brief is not None:
         for theme in brief.themes:
             for word in theme.split():
                 word = word.strip().lower()
                 if len(word) > 3:
-                    terms.add(word)
+                    terms.add(sys.intern(word))
 
+    _allowlist_cache = ((roster, world, brief), terms)
     return terms
@@ -7,9 +7,12 @@ to avoid flagging ordinary phrases like "she said as she".
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from wordfreq import zipf_frequency  # type: ignore[import-untyped]
 
@@ -21,20 +24,23 @@ except ImportError:
     _HAS_WORDFREQ = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossSceneRepetitionResult:
     """Result of cross-scene repetition analysis."""
 
-    repeated_phrases: list[str] = field(default_factory=list)
+    repeated_phrases: tuple[str, ...] = ()
     repeated_count: int = 0
 
 
+def _normalize_words(text: str) -> list[str]:
+    """Lowercase, split, and strip leading/trailing punctuation per word."""
+    words = [w.strip(".,!?;:\"'()-\u2014\u2013") for w in text.lower().split()]
+    return [w for w in words if w]
+
+
 def _extract_ngrams(text: str, min_n: int, max_n: int) -> set[str]:
     """Extract normalized n-grams from text."""
-    words = text.lower().split()
-    # Strip leading/trailing punctuation from each word
-    words = [w.strip(".,!?;:\"'()-\u2014\u2013") for w in words]
-    words = [w for w in words if w]
+    words = _normalize_words(text)
 
     ngrams: set[str] = set()
     for n in range(min_n, max_n + 1):
@@ -44,6 +50,62 @@ def _extract_ngrams(text: str, min_n: int, max_n: int) -> set[str]:
     return ngrams
 
 
+# Large odd multiplier for the rolling polynomial hash (FNV prime).
+_HASH_PRIME = np.uint64(1099511628211)
+
+
+def _word_hashes(words: list[str]) -> np.ndarray:
+    """Per-word 64-bit hashes as a numpy array."""
+    return np.fromiter(
+        (hash(w) & 0xFFFFFFFFFFFFFFFF for w in words),
+        dtype=np.uint64,
+        count=len(words),
+    )
+
+
+def _ngram_hashes(ids: np.ndarray, n: int) -> np.ndarray:
+    """Rolling polynomial hash of every n-gram, one array op per position k.
+
+    Replaces the per-position slice/join/hash loop: for L words this does
+    n vectorized multiply-adds over the whole array instead of ~L Python
+    string constructions. uint64 arithmetic wraps, which is fine for a
+    hash.
+    """
+    length = len(ids)
+    if length < n:
+        return np.empty(0, dtype=np.uint64)
+    h = ids[: length - n + 1].copy()
+    for k in range(1, n):
+        h *= _HASH_PRIME
+        h += ids[k : length - n + 1 + k]
+    return h
+
+
+@lru_cache(maxsize=256)
+def _prose_ngram_data(
+    prose: str, min_n: int, max_n: int
+) -> tuple[tuple[str, ...], dict[int, np.ndarray]]:
+    """Normalized words and per-n n-gram hashes for one prose, memoized.
+
+    Prior scenes are re-checked on every editor pass (scene 5 re-reads
+    scenes 1-4), so without this the pipeline does O(N^2) extraction work
+    over an N-scene story.
+    """
+    words = _normalize_words(prose)
+    ids = _word_hashes(words)
+    return tuple(words), {n: _ngram_hashes(ids, n) for n in range(min_n, max_n + 1)}
+
+
+@lru_cache(maxsize=None)
+def _is_common_word(word: str) -> bool:
+    """Whether a word is very common (Zipf > 5.0), memoized.
+
+    zipf_frequency is pure and candidate n-grams reuse the same words
+    heavily, so per-word memoization removes nearly all wordfreq calls.
+    """
+    return zipf_frequency(word, "en") > 5.0
+
+
 def _is_common_collocation(ngram: str) -> bool:
     """Check if all words in the n-gram are very common (high Zipf frequency).
 
@@ -53,8 +115,7 @@ def _is_common_collocation(ngram: str) -> bool:
     if not _HAS_WORDFREQ:
         return False
 
-    words = ngram.split()
-    return all(zipf_frequency(w, "en") > 5.0 for w in words)
+    return all(_is_common_word(w) for w in ngram.split())
 
 
 def detect_cross_scene_repetition(
@@ -77,28 +138,61 @@ def detect_cross_scene_repetition(
     if not prior_scene_proses or not current_prose.strip():
         return CrossSceneRepetitionResult()
 
-    current_ngrams = _extract_ngrams(current_prose, min_ngram, max_ngram)
-
-    # Build combined n-gram set from all prior scenes
-    prior_ngrams: set[str] = set()
-    for prior_prose in prior_scene_proses:
-        if prior_prose.strip():
-            prior_ngrams.update(_extract_ngrams(prior_prose, min_ngram, max_ngram))
-
-    # Find intersection
-    shared = current_ngrams & prior_ngrams
-
-    # Filter out common collocations
-    repeated = [ng for ng in sorted(shared) if not _is_common_collocation(ng)]
-
-    # Remove substrings: if "fascinating no impossible" is found, don't also
-    # report "fascinating no" (shorter n-gram contained in longer one)
+    # Compare rolling n-gram hashes instead of materialized strings; the
+    # string form is only built for positions whose hash matches on both
+    # sides, which also makes the comparison collision-proof.
+    cur_words = _normalize_words(current_prose)
+    cur_ids = _word_hashes(cur_words)
+    # Prior scenes are stable across editor passes; reuse their extraction.
+    prior_data = [
+        _prose_ngram_data(p, min_ngram, max_ngram)
+        for p in prior_scene_proses
+        if p.strip()
+    ]
+
+    prior_word_lists = [words for words, _hashes in prior_data]
+
+    shared: set[str] = set()
+    for n in range(min_ngram, max_ngram + 1):
+        cur_h = _ngram_hashes(cur_ids, n)
+        if cur_h.size == 0:
+            continue
+        prior_hs = [hashes[n] for _words, hashes in prior_data]
+        if not any(h.size for h in prior_hs):
+            continue
+        common = np.intersect1d(cur_h, np.concatenate(prior_hs))
+        if common.size == 0:
+            continue
+        cur_strings = {
+            " ".join(cur_words[i : i + n])
+            for i in np.flatnonzero(np.isin(cur_h, common))
+        }
+        prior_strings: set[str] = set()
+        for words, h in zip(prior_word_lists, prior_hs):
+            for i in np.flatnonzero(np.isin(h, common)):
+                prior_strings.add(" ".join(words[i : i + n]))
+        shared |= cur_strings & prior_strings
+
+    # Filter out common collocations and dedup in one pass: sort once by
+    # (length desc, alphabetical) — equivalent to the old alphabetical
+    # sort followed by a stable length sort — then drop any phrase already
+    # contained in a longer kept one ("fascinating no" inside
+    # "fascinating no impossible").
+    candidates = [ng for ng in shared if not _is_common_collocation(ng)]
+    candidates.sort(key=lambda s: (-len(s), s))
+
+    # Kept phrases are concatenated into one newline-separated buffer so
+    # each containment test is a single C-level substring search instead
+    # of one scan per kept phrase. Newline can't occur inside a phrase
+    # (words are whitespace-split), so no false cross-phrase matches.
     deduplicated: list[str] = []
-    for phrase in sorted(repeated, key=len, reverse=True):
-        if not any(phrase in longer for longer in deduplicated):
+    kept_buffer = ""
+    for phrase in candidates:
+        if phrase not in kept_buffer:
             deduplicated.append(phrase)
+            kept_buffer += "\n" + phrase
 
     return CrossSceneRepetitionResult(
-        repeated_phrases=deduplicated,
+        repeated_phrases=tuple(deduplicated),
         repeated_count=len(deduplicated),
     )
@@ -9,61 +9,350 @@ Detects AI-characteristic patterns via:
 
 from __future__ import annotations
 
+import os
+import pickle
 import re
 from dataclasses import dataclass, field
+from pathlib import Path
 
+import ai_writer.utils.slop_data as slop_data
 from ai_writer.prompts.configs import SlopConfig
 from ai_writer.utils.slop_data import (
     get_custom_phrases,
     get_slop_phrases,
     get_slop_words,
 )
+from ai_writer.utils.text_analysis._preprocess import preprocess
+
+try:  # Optional SIMD multi-pattern engine; the regex alternation still works
+    import hyperscan
+
+    _HAS_HYPERSCAN = True
+except ImportError:
+    _HAS_HYPERSCAN = False
+
+try:  # Optional linear-time literal matcher (all slop phrases are literals)
+    import ahocorasick
+
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+_WORD_TOKEN_RE = re.compile(r"\S+")
 
 # --- Phrase Pattern Cache ---
 
-_compiled_phrases: list[tuple[re.Pattern[str], float, str]] | None = None
+_phrase_weights: dict[str, float] | None = None
 
+# (combined pattern, phrase -> shadowed prefix phrases)
+_combined_phrases: tuple[re.Pattern[str], dict[str, tuple[str, ...]]] | None = None
 
-def _get_compiled_phrases() -> list[tuple[re.Pattern[str], float, str]]:
-    """Compile phrase patterns from vendored + custom data (cached after first call).
+# (compiled hyperscan database, phrase list indexed by pattern id)
+_hyperscan_db: tuple["hyperscan.Database", list[str]] | None = None
 
-    Merges vendored phrases with project-specific custom phrases.
-    For duplicates, the higher penalty weight wins.
+# Aho-Corasick automaton over the lowercased phrase set
+_aho_automaton: "ahocorasick.Automaton | None" = None
 
-    Returns list of (compiled_pattern, penalty_weight, original_phrase).
+# Per-severity slop-word lookup: lowercased word -> (original word, weight)
+_word_weight_maps: dict[float, dict[str, tuple[str, float]]] = {}
+
+
+def _get_word_weight_map(min_severity: float) -> dict[str, tuple[str, float]]:
+    """Slop-word weights as a dict keyed by lowercased word (cached).
+
+    Lets the word scan iterate the prose's unique words (typically a few
+    hundred) with O(1) lookups instead of walking all 2000 slop entries
+    per call.
+    """
+    weight_map = _word_weight_maps.get(min_severity)
+    if weight_map is None:
+        weight_map = {
+            word.lower(): (word, weight)
+            for word, weight in get_slop_words(min_severity=min_severity)
+        }
+        _word_weight_maps[min_severity] = weight_map
+    return weight_map
+
+
+def _get_phrase_weights() -> dict[str, float]:
+    """Merged phrase -> penalty-weight map (cached after first call).
+
+    Merges vendored phrases with project-specific custom phrases; for
+    duplicates, the higher penalty weight wins. Phrases under 3 chars are
+    dropped (too noisy to match).
+    """
+    global _phrase_weights
+    if _phrase_weights is None:
+        merged: dict[str, float] = {}
+        for phrase, weight in get_slop_phrases(min_severity=0.0):
+            merged[phrase.strip().lower()] = weight
+        for phrase, weight in get_custom_phrases():
+            key = phrase.strip().lower()
+            merged[key] = max(merged.get(key, 0.0), weight)
+        _phrase_weights = {p: w for p, w in merged.items() if len(p) >= 3}
+    return _phrase_weights
+
+
+def _get_combined_phrases() -> tuple[re.Pattern[str], dict[str, tuple[str, ...]]]:
+    """Build one combined alternation over all phrases (cached after first call).
+
+    Compiles a single ``(?=\\b(p1|p2|...)\\b)`` lookahead pattern so the
+    prose is walked once instead of once per phrase. The zero-width
+    lookahead lets matches overlap, preserving the semantics of the old
+    per-phrase scan.
+
+    Alternatives are sorted longest-first, so a phrase that is a
+    word-boundary prefix of a longer phrase (e.g. "orchestra" inside
+    "orchestra of") is shadowed at that position; the returned prefix map
+    records those pairs so the scan can credit both.
+
+    Returns (pattern, prefix_subphrases).
     """
-    global _compiled_phrases
-    if _compiled_phrases is not None:
-        return _compiled_phrases
-
-    # Merge vendored + custom, max weight wins for duplicates
-    phrase_weights: dict[str, float] = {}
-    for phrase, weight in get_slop_phrases(min_severity=0.0):
-        phrase_weights[phrase.strip().lower()] = weight
-    for phrase, weight in get_custom_phrases():
-        key = phrase.strip().lower()
-        phrase_weights[key] = max(phrase_weights.get(key, 0.0), weight)
-
-    compiled: list[tuple[re.Pattern[str], float, str]] = []
-    for phrase, weight in phrase_weights.items():
-        if len(phrase) < 3:
+    global _combined_phrases
+    if _combined_phrases is not None:
+        return _combined_phrases
+
+    # The alternation source and prefix map derive only from the phrase
+    # data files, so persist them pickled next to the data (same scheme
+    # as slop_data's processed caches). Note pickling the *compiled*
+    # pattern would gain nothing — re.Pattern pickles by source and is
+    # recompiled on load — but the pickle does skip the O(N^2) prefix-map
+    # construction on later cold starts.
+    data_dir = Path(slop_data.__file__).parent
+    pkl_path = data_dir / "combined_phrases.pkl"
+    sources = [data_dir / "slop_phrases.json", data_dir / "custom_phrases.json"]
+    src_mtime = max(p.stat().st_mtime for p in sources if p.exists())
+    try:
+        if pkl_path.stat().st_mtime >= src_mtime:
+            pattern_source, prefix_subphrases = pickle.loads(pkl_path.read_bytes())
+            _combined_phrases = (re.compile(pattern_source), prefix_subphrases)
+            return _combined_phrases
+    except (OSError, EOFError, pickle.UnpicklingError):
+        # EOFError covers a reader racing a concurrent (pre-rename) write
+        pass
+
+    weights = _get_phrase_weights()
+
+    # No IGNORECASE: the phrases are stored lowercased and the scan runs
+    # over a lowercased copy of the prose, which lets sre keep its
+    # case-sensitive literal fast paths.
+    alternatives = sorted(weights, key=len, reverse=True)
+    pattern_source = r"(?=\b(" + "|".join(map(re.escape, alternatives)) + r")\b)"
+    pattern = re.compile(pattern_source)
+
+    prefix_subphrases: dict[str, tuple[str, ...]] = {}
+    for phrase in weights:
+        subs = tuple(
+            q
+            for q in weights
+            if q != phrase
+            and phrase.startswith(q)
+            and re.match(rf"{re.escape(q)}\b", phrase)
+        )
+        if subs:
+            prefix_subphrases[phrase] = subs
+
+    try:
+        # Write-then-rename so concurrent readers (e.g. xdist workers)
+        # never see a truncated pickle; the pid keeps writers apart.
+        tmp_path = pkl_path.with_suffix(f".pkl.{os.getpid()}.tmp")
+        tmp_path.write_bytes(
+            pickle.dumps((pattern_source, prefix_subphrases), protocol=5)
+        )
+        os.replace(tmp_path, pkl_path)
+    except OSError:
+        pass
+
+    _combined_phrases = (pattern, prefix_subphrases)
+    return _combined_phrases
+
+
+def _hs_escape(phrase: str) -> bytes:
+    """Escape a literal phrase for Hyperscan.
+
+    Non-ASCII characters go through ``\\x{...}`` codepoint escapes — the
+    binding rejects raw multi-byte expressions even with HS_FLAG_UTF8.
+    """
+    return "".join(
+        re.escape(c) if ord(c) < 128 else f"\\x{{{ord(c):x}}}" for c in phrase
+    ).encode("ascii")
+
+
+def _get_hyperscan_db() -> tuple["hyperscan.Database", list[str]]:
+    """Compile all phrases into one Hyperscan database (cached).
+
+    Every phrase becomes a caseless literal pattern; Hyperscan matches all
+    of them in a single streaming pass, reporting every (overlapping)
+    occurrence, so no prefix-shadowing compensation is needed.
+    """
+    global _hyperscan_db
+    if _hyperscan_db is None:
+        phrases = list(_get_phrase_weights())
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_hs_escape(p) for p in phrases],
+            ids=list(range(len(phrases))),
+            flags=[
+                hyperscan.HS_FLAG_CASELESS
+                | hyperscan.HS_FLAG_SOM_LEFTMOST
+                | hyperscan.HS_FLAG_UTF8
+            ]
+            * len(phrases),
+        )
+        _hyperscan_db = (db, phrases)
+    return _hyperscan_db
+
+
+def _is_word_byte(b: int) -> bool:
+    """Approximate regex ``\\w`` for a UTF-8 byte (non-ASCII counts as word)."""
+    return (
+        0x61 <= b <= 0x7A  # a-z
+        or 0x41 <= b <= 0x5A  # A-Z
+        or 0x30 <= b <= 0x39  # 0-9
+        or b == 0x5F  # _
+        or b >= 0x80
+    )
+
+
+def _scan_phrases_hyperscan(
+    prose: str, allowlist: set[str]
+) -> dict[str, tuple[int, float, str]]:
+    """Find all phrase hits via Hyperscan, grouped by phrase."""
+    db, phrases = _get_hyperscan_db()
+    weights = _get_phrase_weights()
+    data = prose.encode("utf-8")
+
+    spans: list[tuple[int, int, int]] = []
+
+    def _on_match(pid: int, start: int, end: int, flags: int, ctx: object) -> None:
+        spans.append((pid, start, end))
+
+    db.scan(data, match_event_handler=_on_match)
+
+    groups: dict[str, tuple[int, float, str]] = {}
+    for pid, start, end in spans:
+        # Enforce the \b...\b boundaries the regex engine would apply
+        # (string edges count as non-word context).
+        before = start > 0 and _is_word_byte(data[start - 1])
+        if _is_word_byte(data[start]) == before:
+            continue
+        after = end < len(data) and _is_word_byte(data[end])
+        if _is_word_byte(data[end - 1]) == after:
+            continue
+        key = phrases[pid]
+        if key in allowlist:
+            continue
+        entry = groups.get(key)
+        if entry is None:
+            groups[key] = (1, weights[key], data[start:end].decode("utf-8"))
+        else:
+            groups[key] = (entry[0] + 1, entry[1], entry[2])
+    return groups
+
+
+def _get_aho_automaton() -> "ahocorasick.Automaton":
+    """Build the Aho-Corasick automaton over all phrases (cached).
+
+    One linear pass reports every (overlapping) occurrence of every
+    phrase, so — like Hyperscan — no prefix-shadowing compensation is
+    needed; only the word-boundary filter is applied afterwards.
+    """
+    global _aho_automaton
+    if _aho_automaton is None:
+        automaton = ahocorasick.Automaton()
+        for phrase in _get_phrase_weights():
+            automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        _aho_automaton = automaton
+    return _aho_automaton
+
+
+def _is_word_char(c: str) -> bool:
+    """Approximate regex ``\\w`` for a single character."""
+    return c.isalnum() or c == "_"
+
+
+def _scan_phrases_aho(
+    prose: str, allowlist: set[str]
+) -> dict[str, tuple[int, float, str]]:
+    """Find all phrase hits via Aho-Corasick, grouped by phrase."""
+    automaton = _get_aho_automaton()
+    weights = _get_phrase_weights()
+    lo = prose.lower()  # phrases are stored lowercased
+    n = len(lo)
+
+    groups: dict[str, tuple[int, float, str]] = {}
+    for end, phrase in automaton.iter(lo):
+        start = end - len(phrase) + 1
+        # Enforce the \b...\b boundaries the regex engine would apply
+        # (string edges count as non-word context).
+        before = start > 0 and _is_word_char(lo[start - 1])
+        if _is_word_char(lo[start]) == before:
+            continue
+        after = end + 1 < n and _is_word_char(lo[end + 1])
+        if _is_word_char(lo[end]) == after:
             continue
-        try:
-            pattern = re.compile(rf"\b{re.escape(phrase)}\b", re.IGNORECASE)
-            compiled.append((pattern, weight, phrase))
-        except re.error:
+        if phrase in allowlist:
             continue
+        entry = groups.get(phrase)
+        if entry is None:
+            groups[phrase] = (1, weights[phrase], prose[start : end + 1])
+        else:
+            groups[phrase] = (entry[0] + 1, entry[1], entry[2])
+    return groups
 
-    _compiled_phrases = compiled
-    return _compiled_phrases
 
+def _scan_phrases_regex(
+    prose: str, allowlist: set[str]
+) -> dict[str, tuple[int, float, str]]:
+    """Find all phrase hits via the combined regex alternation, grouped by phrase.
 
-@dataclass
+    Scans a lowercased copy (the pattern is case-sensitive) and slices
+    the original prose by span to keep the matched casing for display.
+    """
+    weights = _get_phrase_weights()
+    pattern, prefix_subphrases = _get_combined_phrases()
+    groups: dict[str, tuple[int, float, str]] = {}
+    lo = prose.lower()
+    # lower() can change length for a few Unicode chars (e.g. 'İ'),
+    # shifting spans — fall back to the phrase text for display then.
+    spans_align = len(lo) == len(prose)
+    for m in pattern.finditer(lo):
+        key = m.group(1)
+        match_text = prose[m.start(1) : m.end(1)] if spans_align else key
+        if key not in allowlist:
+            entry = groups.get(key)
+            if entry is None:
+                groups[key] = (1, weights[key], match_text)
+            else:
+                groups[key] = (entry[0] + 1, entry[1], entry[2])
+        for sub in prefix_subphrases.get(key, ()):
+            if sub not in allowlist:
+                entry = groups.get(sub)
+                if entry is None:
+                    groups[sub] = (1, weights[sub], match_text[: len(sub)])
+                else:
+                    groups[sub] = (entry[0] + 1, entry[1], entry[2])
+    return groups
+
+
+# Engine availability is fixed for the life of the process, so pick the
+# scan function once at import instead of branching on every call. The
+# engines themselves still build their pattern caches lazily.
+if _HAS_HYPERSCAN:
+    _scan_phrases = _scan_phrases_hyperscan
+elif _HAS_AHOCORASICK:
+    _scan_phrases = _scan_phrases_aho
+else:
+    _scan_phrases = _scan_phrases_regex
+
+
+@dataclass(slots=True)
 class SlopResult:
     """Result of weighted slop phrase and word detection."""
 
     # Phrase-level results (deduplicated: "phrase x2 (weight: 0.97)")
-    found_phrases: list[str] = field(default_factory=list)
+    found_phrases: tuple[str, ...] = ()
     total_words: int = 0
     slop_ratio: float = 1.0  # 1.0 = clean, 0.0 = heavy slop
     phrase_count: int = 0  # total phrase hits (including duplicates)
@@ -71,7 +360,7 @@ class SlopResult:
     # Word-level results
     found_words: dict[str, int] = field(default_factory=dict)  # word -> excess count
     # Multi-word phrases only for confirmed_slop chain (no single words, no weights)
-    raw_phrase_list: list[str] = field(default_factory=list)
+    raw_phrase_list: tuple[str, ...] = ()
     # Debugging
     weighted_penalty: float = 0.0  # raw penalty before ratio computation
 
@@ -102,40 +391,36 @@ def compute_slop_score(
     if allowlist is None:
         allowlist = set()
 
-    words = prose.split()
-    total_words = len(words)
+    # The word total and frequency table come from the shared tokenizer,
+    # so vocabulary analysis of the same prose reuses the pass.
+    preprocessed = preprocess(prose)
+    prose_word_counts = preprocessed.word_counts
+    total_words = preprocessed.total_words
     if total_words == 0:
         return SlopResult()
 
     # --- Phrase matching (weighted, with allowlist and dedup) ---
-    # Collect all raw matches first
-    raw_matches: list[tuple[str, float]] = []  # (matched_text, weight)
-
-    for pattern, weight, _original in _get_compiled_phrases():
-        matches = pattern.findall(prose)
-        for match_text in matches:
-            if match_text.lower() in allowlist:
-                continue
-            raw_matches.append((match_text, weight))
-
-    # Deduplicate: group by lowercased text, track count and max weight
-    phrase_groups: dict[str, tuple[int, float, str]] = {}
-    for match_text, weight in raw_matches:
-        key = match_text.lower()
-        if key in phrase_groups:
-            count, max_w, example = phrase_groups[key]
-            phrase_groups[key] = (count + 1, max(max_w, weight), example)
-        else:
-            phrase_groups[key] = (1, weight, match_text)
+    # One pass over the prose with the best available engine; the scan
+    # aggregates hits per phrase as it goes (count, weight, first example)
+    # instead of materializing every hit and regrouping afterwards.
+    phrase_groups = _scan_phrases(prose, allowlist)
 
     # Build display list and compute phrase penalty
     found_phrases: list[str] = []
     phrase_penalty = 0.0
     total_phrase_hits = 0
 
-    for _key, (count, max_weight, example) in sorted(
-        phrase_groups.items(), key=lambda x: x[1][1], reverse=True
-    ):
+    # Weight-descending, then alphabetical so equal weights don't depend
+    # on scan order. Decorating with (-weight, key) lets sort run on
+    # plain C tuple comparison instead of calling a key lambda per item.
+    # (heapq.nlargest was considered, but every caller consumes the full
+    # ordered list, so there is no top-K cutoff to exploit.)
+    decorated = [
+        (-weight, key, count, weight, example)
+        for key, (count, weight, example) in phrase_groups.items()
+    ]
+    decorated.sort()
+    for _neg_w, _key, count, max_weight, example in decorated:
         if count > 1:
             found_phrases.append(f'"{example}" x{count} (weight: {max_weight:.2f})')
         else:
@@ -147,23 +432,19 @@ def compute_slop_score(
     found_words: dict[str, int] = {}
     word_penalty = 0.0
 
-    slop_words = get_slop_words(min_severity=config.word_min_severity)
-    if slop_words:
-        # Count all words in prose (lowercased)
-        prose_word_counts: dict[str, int] = {}
-        for w in words:
-            w_lower = w.lower().strip(".,!?;:\"'()-")
-            if w_lower:
-                prose_word_counts[w_lower] = prose_word_counts.get(w_lower, 0) + 1
-
-        for slop_word, slop_weight in slop_words:
-            if slop_word.lower() in allowlist:
+    word_map = _get_word_weight_map(config.word_min_severity)
+    if word_map:
+        free_occurrences = config.word_free_occurrences
+        for w, count in prose_word_counts.items():
+            if count <= free_occurrences:
+                continue
+            entry = word_map.get(w)
+            if entry is None or w in allowlist:
                 continue
-            count = prose_word_counts.get(slop_word.lower(), 0)
-            excess = count - config.word_free_occurrences
-            if excess > 0:
-                found_words[slop_word] = excess
-                word_penalty += excess * config.word_excess_weight * slop_weight
+            slop_word, slop_weight = entry
+            excess = count - free_occurrences
+            found_words[slop_word] = excess
+            word_penalty += excess * config.word_excess_weight * slop_weight
 
     weighted_penalty = phrase_penalty + word_penalty
 
@@ -173,12 +454,12 @@ def compute_slop_score(
     )
 
     return SlopResult(
-        found_phrases=found_phrases,
+        found_phrases=tuple(found_phrases),
         total_words=total_words,
         slop_ratio=round(ratio, 2),
         phrase_count=total_phrase_hits,
         unique_phrase_count=len(phrase_groups),
         found_words=found_words,
-        raw_phrase_list=[k for k in phrase_groups if len(k.split()) >= 2],
+        raw_phrase_list=tuple(k for k in phrase_groups if len(k.split()) >= 2),
         weighted_penalty=round(weighted_penalty, 3),
     )
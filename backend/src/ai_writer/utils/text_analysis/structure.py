@@ -4,18 +4,20 @@ Detects predictable, repetitive prose patterns that are hallmarks of
 AI-generated writing: uniform sentence openings, low sentence-length
 variation, excessive passive voice, and structurally simple sentences.
 
-All analysis reuses the lazy-cached spaCy model from basics._get_nlp().
+All analysis reuses the shared memoized parse from _cache.get_doc().
 """
 
 from collections import Counter
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from ai_writer.prompts.configs import ProseStructureConfig
-from ai_writer.utils.text_analysis.basics import _get_nlp
+from ai_writer.utils.text_analysis._cache import get_doc
 
 
-@dataclass
+@dataclass(slots=True)
 class ProseStructureResult:
     """Structural monotony analysis results."""
 
@@ -68,15 +70,18 @@ class ProseStructureResult:
         return lines
 
 
-def _mean(values: Sequence[float]) -> float:
-    return sum(values) / len(values) if values else 0.0
-
+def _mean_std(values: Sequence[float]) -> tuple[float, float]:
+    """Population mean and std in one numpy reduction.
 
-def _std(values: Sequence[float], mean: float) -> float:
-    if len(values) < 2:
-        return 0.0
-    variance = sum((v - mean) ** 2 for v in values) / len(values)
-    return variance**0.5
+    Matches the old pure-Python helpers: empty input -> (0, 0), a single
+    value -> (value, 0).
+    """
+    if not values:
+        return 0.0, 0.0
+    a = np.asarray(values, dtype=np.float64)
+    if a.size < 2:
+        return float(a[0]), 0.0
+    return float(a.mean()), float(a.std())
 
 
 def compute_prose_structure(
@@ -101,25 +106,42 @@ def compute_prose_structure(
     if config is None:
         config = ProseStructureConfig()
 
-    nlp = _get_nlp()
-    if nlp is None:
+    doc = get_doc(prose)
+    if doc is None:
         return ProseStructureResult()
 
-    doc = nlp(prose)
     sentences = list(doc.sents)
     sentence_count = len(sentences)
 
     if sentence_count == 0:
         return ProseStructureResult()
 
-    # --- Sentence openings ---
+    # --- Single fused pass over all tokens ---
+    # Openers, sentence lengths, passive detection, and dependency
+    # distances all come from one sweep instead of three sentence loops
+    # plus a doc-wide token loop; every token crosses the C/Python
+    # boundary once.
     opener_pos_counts: Counter[str] = Counter()
+    sent_lengths: list[int] = []
+    passive_count = 0
+
     for sent in sentences:
-        # Skip leading whitespace/punctuation to find the real first token
+        opener_seen = False
+        length = 0
+        has_passive = False
         for token in sent:
             if not token.is_space and not token.is_punct:
-                opener_pos_counts[token.pos_] += 1
-                break
+                # First real token is the opener
+                if not opener_seen:
+                    opener_pos_counts[token.pos_] += 1
+                    opener_seen = True
+                length += 1
+            if token.dep_ in ("nsubjpass", "auxpass"):
+                # spaCy marks passive subjects/auxiliaries with these deps
+                has_passive = True
+        sent_lengths.append(length)
+        if has_passive:
+            passive_count += 1
 
     if opener_pos_counts:
         top_pos, top_count = opener_pos_counts.most_common(1)[0]
@@ -133,32 +155,29 @@ def compute_prose_structure(
         opener_dist = {}
 
     # --- Sentence length variation ---
-    sent_lengths = [
-        len([t for t in sent if not t.is_space and not t.is_punct])
-        for sent in sentences
-    ]
-    length_mean = _mean(sent_lengths)
-    length_std = _std(sent_lengths, length_mean)
+    length_mean, length_std = _mean_std(sent_lengths)
     length_cv = (length_std / length_mean) if length_mean > 0 else 0.0
 
-    # --- Passive voice detection ---
-    # spaCy marks passive subjects with nsubjpass and passive auxiliaries with auxpass
-    passive_count = 0
-    for sent in sentences:
-        has_passive = any(token.dep_ in ("nsubjpass", "auxpass") for token in sent)
-        if has_passive:
-            passive_count += 1
+    # --- Passive voice ratio ---
     passive_ratio = passive_count / sentence_count
 
     # --- Dependency distance variation ---
-    # Distance = abs(token.i - token.head.i) for non-root tokens
-    dep_distances: list[float] = []
-    for token in doc:
-        if token.dep_ != "ROOT" and not token.is_space:
-            dep_distances.append(float(abs(token.i - token.head.i)))
-
-    dep_mean = _mean(dep_distances)
-    dep_std = _std(dep_distances, dep_mean)
+    # Distance = abs(token.i - token.head.i) for non-root, non-space
+    # tokens. HEAD in to_array is the head's offset relative to each
+    # token, so the distances are one vectorized abs over the export
+    # instead of a per-token attribute loop.
+    from spacy.attrs import DEP, HEAD, IS_SPACE  # deferred like the model itself
+
+    arr = doc.to_array([HEAD, DEP, IS_SPACE])
+    mask = (arr[:, 1] != doc.vocab.strings["ROOT"]) & (arr[:, 2] == 0)
+    dep_distances = np.abs(arr[:, 0].astype(np.int64)[mask])
+
+    if dep_distances.size:
+        dep_mean = float(dep_distances.mean())
+        dep_std = float(dep_distances.std()) if dep_distances.size >= 2 else 0.0
+    else:
+        dep_mean = 0.0
+        dep_std = 0.0
 
     return ProseStructureResult(
         sentence_count=sentence_count,
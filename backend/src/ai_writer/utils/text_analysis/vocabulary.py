@@ -1,28 +1,22 @@
 """Vocabulary diversity, sophistication, and readability analysis.
 
-Uses three lightweight pure-Python libraries:
-- lexicalrichness: MTLD and MATTR for vocabulary diversity
-- wordfreq: Zipf frequency for vocabulary sophistication
-- textstat: Readability formulas (Flesch, Gunning-Fog)
+MTLD, MATTR, and the readability formulas (Flesch reading ease,
+Gunning-Fog) are computed natively; wordfreq supplies Zipf frequency
+for vocabulary sophistication.
 """
 
 from __future__ import annotations
 
+import re
+import string
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from lexicalrichness import LexicalRichness  # type: ignore[import-untyped]
-    from textstat import textstat as ts  # type: ignore[import-untyped]
     from wordfreq import zipf_frequency  # type: ignore[import-untyped]
 
-try:
-    from lexicalrichness import LexicalRichness  # type: ignore[import-untyped]
-
-    _HAS_LEXICALRICHNESS = True
-except ImportError:
-    _HAS_LEXICALRICHNESS = False
-
 try:
     from wordfreq import zipf_frequency  # type: ignore[import-untyped]
 
@@ -30,28 +24,167 @@ try:
 except ImportError:
     _HAS_WORDFREQ = False
 
-try:
-    from textstat import textstat as ts  # type: ignore[import-untyped]
+from ai_writer.prompts.configs import VocabularyConfig
+from ai_writer.utils.text_analysis._preprocess import preprocess
 
-    _HAS_TEXTSTAT = True
-except ImportError:
-    _HAS_TEXTSTAT = False
+# --- Lexical diversity (native MTLD / MATTR) ---
+#
+# Tokenization mirrors lexicalrichness: lowercase, drop digits, join
+# hyphenated/dashed words, then treat remaining punctuation as spaces —
+# so scores stay comparable with historical runs.
 
-from ai_writer.prompts.configs import VocabularyConfig
+_DIGIT_RE = re.compile(r"[0-9]+")
+_PUNCT_TO_SPACE = str.maketrans({p: " " for p in string.punctuation})
+
+
+def _diversity_tokens(prose: str) -> list[str]:
+    """Tokenize prose for the diversity measures."""
+    text = _DIGIT_RE.sub("", prose.lower())
+    text = text.replace("–", "").replace("—", "").replace("-", "")
+    return text.translate(_PUNCT_TO_SPACE).split()
 
 
-@dataclass
+def _mtld_pass(tokens: list[str], threshold: float) -> float:
+    """One directional MTLD pass (McCarthy & Jarvis 2010).
+
+    Walks the tokens keeping a running TTR; each time it falls to the
+    threshold a factor is counted and the segment restarts. The trailing
+    partial segment contributes fractionally by how far its TTR sits
+    between 1 and the threshold.
+    """
+    terms: set[str] = set()
+    word_counter = 0
+    factor_count = 0.0
+    ttr = 1.0
+
+    for word in tokens:
+        word_counter += 1
+        terms.add(word)
+        ttr = len(terms) / word_counter
+        if ttr <= threshold:
+            word_counter = 0
+            terms = set()
+            factor_count += 1
+
+    if word_counter > 0:
+        factor_count += (1 - ttr) / (1 - threshold)
+
+    if factor_count == 0:
+        # TTR never dropped below threshold — score the whole text
+        overall = len(set(tokens)) / len(tokens)
+        if overall == 1:
+            factor_count += 1
+        else:
+            factor_count += (1 - overall) / (1 - threshold)
+
+    return len(tokens) / factor_count
+
+
+def _mtld(tokens: list[str], threshold: float = 0.72) -> float:
+    """Measure of Textual Lexical Diversity — mean of both directions."""
+    if not tokens:
+        return 0.0
+    forward = _mtld_pass(tokens, threshold)
+    backward = _mtld_pass(tokens[::-1], threshold)
+    return (forward + backward) / 2
+
+
+def _mattr(tokens: list[str], window_size: int) -> float:
+    """Moving-average TTR over sliding windows, in one rolling pass.
+
+    A running per-window Counter is updated as the window slides, so the
+    cost is O(n) instead of rebuilding a set per window.
+    """
+    n = len(tokens)
+    if n == 0 or window_size < 1:
+        return 0.0
+    window = min(window_size, n)
+
+    counts: Counter[str] = Counter(tokens[:window])
+    distinct_total = len(counts)
+    num_windows = 1
+
+    for i in range(window, n):
+        outgoing = tokens[i - window]
+        counts[outgoing] -= 1
+        if counts[outgoing] == 0:
+            del counts[outgoing]
+        counts[tokens[i]] += 1
+        distinct_total += len(counts)
+        num_windows += 1
+
+    return distinct_total / num_windows / window
+
+
+# --- Readability (native Flesch / Gunning-Fog) ---
+#
+# Both formulas consume the same aggregates (sentence, word, syllable,
+# and complex-word counts), so one pass feeds both. Syllables use a
+# vowel-group approximation with a silent-e adjustment — close enough
+# for the coarse thresholds these scores gate, without textstat's
+# double tokenization and dictionary lookups.
+
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+
+
+def _syllables(word: str) -> int:
+    """Approximate syllable count of a lowercased word."""
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def _readability(
+    prose: str, word_counts: Counter[str], total_words: int
+) -> tuple[float, float]:
+    """Flesch reading ease and Gunning-Fog from one shared pass.
+
+    Reuses the shared tokenizer's frequency table so each distinct word
+    is syllable-counted once, weighted by its occurrences.
+    """
+    sentence_count = max(1, len(_SENTENCE_END_RE.findall(prose)))
+
+    syllable_total = 0
+    complex_words = 0
+    for word, count in word_counts.items():
+        syl = _syllables(word)
+        syllable_total += syl * count
+        if syl >= 3:
+            complex_words += count
+
+    words_per_sentence = total_words / sentence_count
+    flesch = (
+        206.835 - 1.015 * words_per_sentence - 84.6 * (syllable_total / total_words)
+    )
+    fog = 0.4 * (words_per_sentence + 100 * complex_words / total_words)
+    return flesch, fog
+
+
+@lru_cache(maxsize=65536)
+def _zipf(word: str) -> float:
+    """Zipf frequency of a word, memoized.
+
+    Prose repeats content words heavily and the same vocabulary recurs
+    across scenes, so caching reduces wordfreq lookups to the count of
+    distinct words seen per process.
+    """
+    return zipf_frequency(word, "en")
+
+
+@dataclass(slots=True)
 class VocabularyResult:
     """Vocabulary diversity and sophistication metrics."""
 
-    # Lexical diversity (lexicalrichness)
+    # Lexical diversity
     mtld: float = 0.0  # Measure of Textual Lexical Diversity
     mattr: float = 0.0  # Moving Average TTR (window=50)
     low_diversity: bool = False  # True if MTLD < threshold
     # Vocabulary sophistication (wordfreq)
     avg_zipf_frequency: float = 0.0  # avg Zipf score of content words
     vocabulary_basic: bool = False  # True if avg_zipf > threshold
-    # Readability (textstat)
+    # Readability
     flesch_reading_ease: float = 0.0
     gunning_fog: float = 0.0
 
@@ -84,43 +217,31 @@ def compute_vocabulary_metrics(
     if config is None:
         config = VocabularyConfig()
 
-    words = prose.split()
-    if len(words) < 10:
+    # Shared tokenizer — the slop scan of the same prose reuses this pass.
+    preprocessed = preprocess(prose)
+    total_words = preprocessed.total_words
+    if total_words < 10:
         return VocabularyResult()
 
-    # --- Lexical diversity (lexicalrichness) ---
-    if _HAS_LEXICALRICHNESS:
-        lex = LexicalRichness(prose)
-
-        try:
-            mtld = lex.mtld(threshold=0.72)
-        except ZeroDivisionError:
-            mtld = 0.0
-
-        try:
-            mattr = lex.mattr(window_size=min(config.mattr_window, len(words)))
-        except ZeroDivisionError:
-            mattr = 0.0
-    else:
-        mtld = 0.0
-        mattr = 0.0
+    # --- Lexical diversity (native MTLD / MATTR) ---
+    diversity_tokens = _diversity_tokens(prose)
+    mtld = _mtld(diversity_tokens, threshold=0.72)
+    mattr = _mattr(diversity_tokens, min(config.mattr_window, total_words))
 
     # --- Vocabulary sophistication (wordfreq) ---
     # Only score content words (skip short function words)
-    content_words = [w.lower() for w in words if len(w) > 3 and w.isalpha()]
+    content_words = preprocessed.content_words_lower
     if _HAS_WORDFREQ and content_words:
-        zipf_scores = [zipf_frequency(w, "en") for w in content_words]
-        avg_zipf = sum(zipf_scores) / len(zipf_scores)
+        # Dedup before lookup — each distinct word is scored once and
+        # weighted by its count.
+        word_counts = Counter(content_words)
+        total = sum(_zipf(w) * count for w, count in word_counts.items())
+        avg_zipf = total / len(content_words)
     else:
         avg_zipf = 0.0
 
-    # --- Readability (textstat) ---
-    if _HAS_TEXTSTAT:
-        flesch = ts.flesch_reading_ease(prose)
-        fog = ts.gunning_fog(prose)
-    else:
-        flesch = 0.0
-        fog = 0.0
+    # --- Readability (native Flesch / Gunning-Fog) ---
+    flesch, fog = _readability(prose, preprocessed.word_counts, total_words)
 
     return VocabularyResult(
         mtld=round(mtld, 1),
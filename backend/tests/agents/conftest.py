@@ -0,0 +1,26 @@
+"""Shared fixtures for the agent tests.
+
+The agent test modules build their graph states from an identical story
+brief; one session-scoped instance serves all of them, so each xdist
+worker constructs it once instead of once per module import.
+"""
+
+import pytest
+
+from ai_writer.schemas.story import Genre, StoryBrief, ToneProfile
+
+
+@pytest.fixture(scope="session")
+def story_brief():
+    """Session-wide StoryBrief for agent states (never mutated by tests).
+
+    Built with model_construct: the field values are literal and already
+    type-correct, so validation is skipped entirely.
+    """
+    return StoryBrief.model_construct(
+        title="Test",
+        premise="A story",
+        genre=Genre.SCI_FI,
+        themes=["hope"],
+        tone_profile=ToneProfile.model_construct(formality=0.5, darkness=0.3),
+    )
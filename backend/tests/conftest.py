@@ -13,3 +13,15 @@ def test_settings():
         langchain_tracing_v2=False,
         langchain_api_key="",
     )
+
+
+@pytest.fixture(scope="session")
+def compiled_pipeline():
+    """Build and compile the prototype graph once per session.
+
+    Graph construction/compilation is the expensive part; the compiled
+    graph is stateless, so any test needing one can share it.
+    """
+    from ai_writer.pipelines.prototype import get_prototype_pipeline
+
+    return get_prototype_pipeline()
@@ -1,5 +1,7 @@
 """Tests for character schemas."""
 
+import pytest
+
 from ai_writer.schemas.characters import (
     CharacterProfile,
     CharacterRelationship,
@@ -19,10 +21,10 @@ class TestCharacterProfile:
         assert cp.name == "Alice"
         assert cp.personality_traits == []
 
-    def test_all_roles(self):
-        for role in CharacterRole:
-            cp = CharacterProfile(character_id="x", name="Test", role=role)
-            assert cp.role == role
+    @pytest.mark.parametrize("role", list(CharacterRole), ids=lambda r: r.value)
+    def test_all_roles(self, role):
+        cp = CharacterProfile(character_id="x", name="Test", role=role)
+        assert cp.role == role
 
 
 class TestCharacterRoster:
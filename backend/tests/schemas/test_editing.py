@@ -1,5 +1,8 @@
 """Tests for editor feedback schemas."""
 
+import json
+from dataclasses import asdict
+
 import pytest
 from pydantic import ValidationError
 
@@ -383,7 +386,7 @@ class TestSceneMetrics:
             sent_length_cv=0.42,
             word_count=1050,
         )
-        data = metrics.model_dump()
+        data = asdict(metrics)
         assert data["scene_id"] == "s1"
         assert data["slop_ratio"] == 0.92
         assert data["mtld"] == 72.5
@@ -400,8 +403,8 @@ class TestSceneMetrics:
             sent_length_cv=0.55,
             word_count=900,
         )
-        json_str = metrics.model_dump_json()
-        restored = SceneMetrics.model_validate_json(json_str)
+        json_str = json.dumps(asdict(metrics))
+        restored = SceneMetrics(**json.loads(json_str))
         assert restored == metrics
 
 
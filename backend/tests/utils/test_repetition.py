@@ -21,7 +21,7 @@ class TestDetectCrossSceneRepetition:
         prior = ["She walked through the garden, smelling the roses."]
         result = detect_cross_scene_repetition(current, prior)
         assert result.repeated_count == 0
-        assert result.repeated_phrases == []
+        assert result.repeated_phrases == ()
 
     def test_single_scene_no_prior(self):
         """First scene has no prior scenes — should return empty."""
@@ -227,7 +227,7 @@ class TestRawPhraseList:
         """raw_phrase_list should be empty when no phrases found."""
         prose = "The cat sat on the mat."
         result = compute_slop_score(prose)
-        assert result.raw_phrase_list == []
+        assert result.raw_phrase_list == ()
 
     def test_raw_phrase_list_empty_when_only_single_words(self):
         """raw_phrase_list should be empty when only single-word slop found."""
@@ -236,7 +236,7 @@ class TestRawPhraseList:
         # Single words detected in found_phrases
         assert result.phrase_count > 0
         # But raw_phrase_list has no multi-word phrases
-        assert result.raw_phrase_list == []
+        assert result.raw_phrase_list == ()
 
     def test_raw_phrase_list_deduplicates(self):
         """Phrase appearing 3x should produce 1 entry in raw_phrase_list."""